@@ -0,0 +1,233 @@
+# --- Imports ---
+import argparse
+import csv
+import getpass
+import multiprocessing
+import os
+import queue
+import time
+import pandas as pd
+from scraper import create_scraper, add_scraper_arguments, scraper_options, rate_limiter_from_args, sanitize_filename
+from profile_store import ProfileStore
+from page_cache import PageCache
+from output_writers import output_path, read_output
+
+try:
+    from dotenv import load_dotenv # Optional: read LINKEDIN_EMAIL / LINKEDIN_PASSWORD from a .env file
+except ImportError:
+    load_dotenv = None
+
+# Non-interactive batch mode: runs many searches from a job file across several browser workers.
+#
+# Job file (CSV with a header row), one search per line:
+#   search_url,page_limit,output_file
+#   https://www.linkedin.com/search/results/people/?keywords=data%20engineer,5,data_engineers.csv
+#   https://www.linkedin.com/search/results/people/?keywords=designer,all,designers.csv
+#
+# Usage: python batch.py jobs.csv --workers 4 [--combined all_results.csv] [scraper options]
+
+def read_jobs(path):
+    """Reads and validates the job file. Returns a list of job dicts, each with its own output file."""
+    jobs = []
+    used_files = set() # Normalized paths of the output files taken so far
+    with open(path, newline='', encoding='utf-8') as f:
+        for line_number, row in enumerate(csv.DictReader(f), start=2): # Line 1 is the header
+            search_url = (row.get("search_url") or "").strip()
+            if not search_url or search_url.startswith("#"):
+                continue
+            if not search_url.startswith("https://www.linkedin.com/search/results/"):
+                print(f"Skipping line {line_number}: not a LinkedIn search results URL ({search_url}).")
+                continue
+
+            limit_text = (row.get("page_limit") or "all").strip().lower()
+            if limit_text in ("", "all"):
+                page_limit = float('inf')
+            else:
+                try:
+                    page_limit = int(limit_text)
+                except ValueError:
+                    page_limit = 0
+                if page_limit <= 0:
+                    print(f"Skipping line {line_number}: page_limit must be a positive number or 'all' (got '{limit_text}').")
+                    continue
+
+            output_file = sanitize_filename(row.get("output_file") or f"search_{len(jobs) + 1}")
+            if not output_file.lower().endswith('.csv'):
+                output_file += ".csv"
+            # Two jobs writing one file (and one --stream checkpoint) would overwrite each other
+            base, extension = os.path.splitext(output_file)
+            suffix = 1
+            while os.path.normcase(os.path.abspath(output_file)) in used_files:
+                suffix += 1
+                output_file = f"{base}_{suffix}{extension}"
+            if suffix > 1:
+                print(f"Line {line_number}: output file '{base}{extension}' is already used by another job, writing '{output_file}' instead.")
+            used_files.add(os.path.normcase(os.path.abspath(output_file)))
+            jobs.append({"job": len(jobs) + 1, "search_url": search_url,
+                         "page_limit": page_limit, "output_file": output_file})
+    return jobs
+
+def run_worker(worker_id, username, password, options, store_path, page_cache_dir, page_cache_bytes,
+               rate_limiter, job_queue, result_queue):
+    """Worker process: owns one browser and logged-in session, and scrapes jobs until it gets None."""
+    scraper = None
+    if options.get("metrics_prometheus"): # One counters file per worker, e.g. metrics.worker1.prom
+        base, extension = os.path.splitext(options["metrics_prometheus"])
+        options = dict(options, metrics_prometheus=f"{base}.worker{worker_id}{extension}")
+    try:
+        store = ProfileStore(store_path) if store_path else None
+        page_cache = PageCache(page_cache_dir, max_bytes=page_cache_bytes) if page_cache_dir else None
+        scraper = create_scraper(username, password, store=store, page_cache=page_cache, rate_limiter=rate_limiter,
+                                 interactive=False, **options)
+        scraper.login()
+    except (SystemExit, Exception) as e:
+        result_queue.put({"type": "worker_failed", "worker": worker_id, "error": str(e) or "login failed"})
+        if scraper:
+            scraper.close()
+        return
+
+    job = None
+    try:
+        while True:
+            job = job_queue.get()
+            if job is None: # No more work
+                break
+            print(f"[worker {worker_id}] Starting job {job['job']}: {job['search_url']}")
+            started = time.time()
+            try:
+                summary = scraper.scrape_search(job["search_url"], job["page_limit"], job["output_file"])
+            except Exception as e:
+                print(f"[worker {worker_id}] Job {job['job']} failed: {e}")
+                scraper.save_results(job["output_file"]) # Keep whatever was collected
+                summary = {"status": "error", "pages": 0, "profiles": scraper.search_profile_count, "error": str(e)}
+            summary.update(job)
+            summary.update({"type": "job_done", "worker": worker_id, "seconds": round(time.time() - started, 1)})
+            result_queue.put(summary)
+    except KeyboardInterrupt:
+        if scraper.search_profile_count and job:
+            print(f"[worker {worker_id}] Interrupted, saving data collected so far for '{job['output_file']}'...")
+            scraper.save_results(job["output_file"])
+    finally:
+        scraper.close()
+
+def combine_outputs(results, combined_file, output_format=None):
+    """Aggregates the per-search output files (CSV, or output_format when streaming) into one CSV with a 'Search URL' column."""
+    frames = []
+    for result in results:
+        path = output_path(result["output_file"], output_format) if output_format else result["output_file"]
+        if result["profiles"] and os.path.exists(path):
+            df = read_output(path, output_format or 'csv')
+            df["Search URL"] = result["search_url"]
+            frames.append(df)
+    if not frames:
+        print("No results to combine.")
+        return
+    combined = pd.concat(frames, ignore_index=True)
+    combined.drop_duplicates(subset=['Profile URL'], keep='first', inplace=True)
+    combined.to_csv(combined_file, index=False, encoding='utf-8')
+    print(f"Combined results saved to '{combined_file}' ({len(combined)} unique profiles)")
+
+def get_credentials():
+    """Reads credentials from LINKEDIN_EMAIL / LINKEDIN_PASSWORD (or a .env file), asking only if missing."""
+    if load_dotenv:
+        load_dotenv()
+    username = os.environ.get("LINKEDIN_EMAIL", "").strip()
+    password = os.environ.get("LINKEDIN_PASSWORD", "").strip()
+    if not username or not password:
+        print("-" * 30)
+        print("Please enter your LinkedIn credentials (or set LINKEDIN_EMAIL and LINKEDIN_PASSWORD):")
+        username = username or input("Email: ").strip()
+        password = password or getpass.getpass("Password: ").strip()
+        print("-" * 30)
+    return username, password
+
+# --- Main Execution Logic ---
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Run many LinkedIn searches from a job file with parallel browsers.")
+    arg_parser.add_argument("job_file", help="CSV file with search_url,page_limit,output_file columns")
+    arg_parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                            help="Number of browser worker processes (default: %(default)s)")
+    arg_parser.add_argument("--summary", default="batch_summary.csv",
+                            help="Where to write the per-job summary (default: %(default)s)")
+    arg_parser.add_argument("--combined", metavar="CSV_FILE",
+                            help="Also write all results into one deduplicated CSV file")
+    add_scraper_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    jobs = read_jobs(args.job_file)
+    if not jobs:
+        print("No valid jobs found in the job file. Exiting.")
+        raise SystemExit(1)
+    worker_count = max(1, min(args.workers, len(jobs)))
+    print(f"Loaded {len(jobs)} jobs. Starting {worker_count} browser workers...")
+
+    linkedin_username, linkedin_password = get_credentials()
+    if not linkedin_username or not linkedin_password:
+        print("Email and password cannot be empty. Exiting.")
+        raise SystemExit(1)
+
+    # --- Shared Work Queue and Rate Limit (one pace for all workers, so more workers do not mean more load) ---
+    rate_limiter = rate_limiter_from_args(args)
+    job_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue()
+    for job in jobs:
+        job_queue.put(job)
+    for _ in range(worker_count):
+        job_queue.put(None) # One stop signal per worker
+
+    workers = [multiprocessing.Process(target=run_worker,
+                                       args=(i + 1, linkedin_username, linkedin_password, scraper_options(args),
+                                             args.store, args.page_cache, args.page_cache_size_mb * 1024 * 1024,
+                                             rate_limiter, job_queue, result_queue))
+               for i in range(worker_count)]
+    started = time.time()
+    for worker in workers:
+        worker.start()
+
+    # --- Collect Results ---
+    results = []
+    failed_workers = 0
+    try:
+        while len(results) < len(jobs):
+            try:
+                message = result_queue.get(timeout=5)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    print("All workers have stopped before finishing every job.")
+                    break
+                continue
+            if message["type"] == "worker_failed":
+                failed_workers += 1
+                print(f"Worker {message['worker']} could not start: {message['error']}")
+                if failed_workers == worker_count:
+                    print("No worker could log in. Exiting.")
+                    break
+                continue
+            results.append(message)
+            print(f"Job {message['job']}/{len(jobs)} finished ({message['status']}): {message['profiles']} profiles "
+                  f"from {message['pages']} pages in {message['seconds']}s -> '{message['output_file']}'")
+    except KeyboardInterrupt:
+        print("\n[INFO] KeyboardInterrupt detected. Waiting for workers to save their data...")
+    finally:
+        for worker in workers:
+            worker.join(timeout=60)
+            if worker.is_alive():
+                worker.terminate()
+
+    # --- Aggregate ---
+    elapsed = time.time() - started
+    total_profiles = sum(r["profiles"] for r in results)
+    total_pages = sum(r["pages"] for r in results)
+    print(f"\nCompleted {len(results)} of {len(jobs)} jobs in {elapsed:.0f}s: {total_pages} pages, {total_profiles} profiles.")
+    print(f"Rate limiter: {rate_limiter.summary()}")
+    if results:
+        summary = pd.DataFrame(results).sort_values("job")
+        summary = summary[["job", "search_url", "page_limit", "output_file", "status", "pages", "profiles", "seconds", "worker", "error"]]
+        summary.to_csv(args.summary, index=False, encoding='utf-8')
+        print(f"Job summary saved to '{args.summary}'")
+        if args.combined:
+            combine_outputs(results, args.combined, args.output_format if args.stream else None)
+    missing = sorted({job["job"] for job in jobs} - {r["job"] for r in results})
+    if missing:
+        print(f"Jobs not completed: {missing}")
+    print("\nBatch finished.")
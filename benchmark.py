@@ -0,0 +1,237 @@
+# --- Imports ---
+import argparse
+import glob
+import gzip
+import json
+import os
+import statistics
+import tempfile
+import time
+import pandas as pd
+from browser_config import (create_chrome_driver, browser_memory_mb, resolve_browser_settings,
+                            DEFAULT_BROWSER_SETTINGS, FAST_BROWSER_SETTINGS)
+from output_writers import open_writer, output_path, OUTPUT_FORMATS
+from page_cache import PageCache
+from profile_parser import parse_profiles, PARSER_BACKENDS
+from profile_store import ProfileStore, normalize_profile_url
+from timing import PhaseTimer
+
+# Benchmarks for the scraper.
+#
+#   python benchmark.py driver [--url URL ...] [--repeat 3] [--all-toggles] [--json results.json]
+#       Starts Chrome with the default settings and with the fast settings (optionally also with
+#       each fast setting on its own), loads the URLs and reports start-up time, page load time
+#       and browser memory (RSS, needs pip install psutil).
+#
+#   python benchmark.py offline [--fixtures DIR | --page-cache DIR | --synthetic 200] [--backend lxml ...]
+#                               [--output-format csv ...] [--json results.json]
+#       Runs everything after the browser (parse, de-duplication + profile store, saving) on saved
+#       pages, without LinkedIn or Chrome, and reports pages/s and milliseconds per page per phase.
+#       Fixtures are .html or .html.gz files (e.g. pages saved from the browser). Without a source,
+#       the sanitized pages in fixtures/ are used (one per known results layout, see FIXTURES_DIR).
+
+# Sanitized search pages shipped with the repo: the entity list (2 pages), linked-area and generic li.result layouts
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def driver_configs(all_toggles=False):
+    """Returns (name, settings) pairs to compare: current defaults, each single toggle, all toggles."""
+    configs = [("default", dict(DEFAULT_BROWSER_SETTINGS))]
+    if all_toggles:
+        for key, fast_value in FAST_BROWSER_SETTINGS.items():
+            if fast_value != DEFAULT_BROWSER_SETTINGS[key]:
+                configs.append((f"{key}={fast_value}", resolve_browser_settings({key: fast_value})))
+    configs.append(("fast", dict(FAST_BROWSER_SETTINGS)))
+    return configs
+
+def benchmark_driver(name, settings, urls, repeat):
+    """Starts one browser with `settings`, loads every URL `repeat` times and returns the measurements."""
+    print(f"\n--- {name}: {settings} ---")
+    started = time.perf_counter()
+    driver = create_chrome_driver(settings)
+    startup_seconds = time.perf_counter() - started
+    load_times = []
+    peak_memory = None
+    try:
+        for _ in range(repeat):
+            for url in urls:
+                started = time.perf_counter()
+                driver.get(url)
+                load_times.append(time.perf_counter() - started)
+                memory = browser_memory_mb(driver)
+                if memory is not None:
+                    peak_memory = max(peak_memory or 0, memory)
+                print(f"  {url}: {load_times[-1]:.2f}s" + (f", browser RSS {memory:.0f} MB" if memory is not None else ""))
+    finally:
+        driver.quit()
+    return {
+        "config": name,
+        "settings": settings,
+        "startup_s": round(startup_seconds, 3),
+        "page_load_mean_s": round(statistics.mean(load_times), 3),
+        "page_load_median_s": round(statistics.median(load_times), 3),
+        "peak_rss_mb": round(peak_memory, 1) if peak_memory is not None else None,
+    }
+
+def print_driver_table(results):
+    print(f"\n{'config':<28}{'startup s':>10}{'load mean s':>13}{'load median s':>15}{'peak RSS MB':>13}")
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.0f}" if r["peak_rss_mb"] is not None else "n/a"
+        print(f"{r['config']:<28}{r['startup_s']:>10.2f}{r['page_load_mean_s']:>13.2f}{r['page_load_median_s']:>15.2f}{rss:>13}")
+    if results[0]["peak_rss_mb"] is None:
+        print("(Install psutil to measure browser memory: pip install psutil)")
+
+def run_driver_benchmark(args):
+    results = [benchmark_driver(name, settings, args.url, args.repeat)
+               for name, settings in driver_configs(args.all_toggles)]
+    print_driver_table(results)
+    return results
+
+def synthetic_page(page, per_page=10, repeated=2, noise=2000):
+    """
+    Builds a results page resembling LinkedIn's markup: `per_page` profiles (the first `repeated`
+    of them also appear on the previous page, to exercise de-duplication), a 'LinkedIn Member'
+    entry and `noise` navigation links/scripts around the results.
+    """
+    first = (page - 1) * (per_page - repeated)
+    items = "".join(
+        f'<li class="reusable-search__result-container"><div class="entity-result">'
+        f'<span class="entity-result__title-text t-16"><a class="app-aware-link" href="https://www.linkedin.com/in/person-{i}?miniProfileUrn=urn%3A{i}">'
+        f'<span dir="ltr"><span aria-hidden="true">Person {i}</span><span class="visually-hidden">View Person {i}&#39;s profile</span></span></a></span>'
+        f'<div class="entity-result__primary-subtitle t-14"> Engineer at Company {i % 97} </div>'
+        f'<div class="entity-result__secondary-subtitle t-14">City {i % 13}</div></div></li>'
+        for i in range(first, first + per_page))
+    member = ('<li class="reusable-search__result-container"><span class="entity-result__title-text">'
+              '<a class="app-aware-link" href="https://www.linkedin.com/search/results/people/">'
+              '<span aria-hidden="true">LinkedIn Member</span></a></span></li>')
+    nav = "".join(f'<a href="/feed/{i}">link {i}</a><script>var x{i} = {i};</script>' for i in range(noise))
+    return (f'<html><head><title>Search</title></head><body><nav>{nav}</nav><div class="search-results-container">'
+            f'<ul class="reusable-search__entity-result-list list-style-none">{items}{member}</ul></div></body></html>')
+
+def load_fixture_pages(directory=FIXTURES_DIR):
+    """Returns the HTML of the .html / .html.gz pages in `directory`, in file name order."""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html")) + glob.glob(os.path.join(directory, "*.html.gz"))):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+def load_offline_pages(args):
+    """Returns the HTML of the pages to benchmark: generated, from a page cache or from fixtures (default)."""
+    if args.synthetic:
+        return [synthetic_page(page) for page in range(1, args.synthetic + 1)]
+    if args.page_cache:
+        cache = PageCache(args.page_cache, max_bytes=float('inf'))
+        try:
+            return [cache.read(key) for search_url, _, _ in cache.searches()
+                    for _, key in cache.latest_pages(search_url) if key]
+        finally:
+            cache.close()
+    return load_fixture_pages(args.fixtures or FIXTURES_DIR)
+
+def benchmark_offline(pages, backend, output_format, workdir):
+    """Runs parse -> de-duplication/store -> streaming save over `pages` like one search does."""
+    timer = PhaseTimer()
+    timer.start_search("offline")
+    store = ProfileStore(os.path.join(workdir, f"store-{backend}-{output_format}.db"))
+    writer = open_writer(output_path(os.path.join(workdir, f"out-{backend}.csv"), output_format), output_format)
+    seen_keys = set()
+    all_records = []
+    started = time.perf_counter()
+    try:
+        for page_number, html in enumerate(pages, start=1):
+            with timer.phase("parse"):
+                page_records = parse_profiles(html, backend=backend)
+            with timer.phase("records"):
+                new_records = []
+                for record in page_records:
+                    key = normalize_profile_url(record["Profile URL"])
+                    if key not in seen_keys:
+                        seen_keys.add(key)
+                        new_records.append(record)
+                store.record_profiles(new_records, "offline")
+            with timer.phase("save"):
+                writer.write_rows(new_records)
+            all_records.extend(new_records)
+            timer.end_page(page_number, len(new_records))
+        with timer.phase("save"):
+            writer.close()
+        elapsed = time.perf_counter() - started
+        # The non-streaming path: one DataFrame written at the end of the search
+        with timer.phase("save_pandas"):
+            pd.DataFrame(all_records).to_csv(os.path.join(workdir, f"out-{backend}-pandas.csv"), index=False, encoding='utf-8')
+    finally:
+        store.close()
+    timer.end_search(len(all_records))
+    page_count = max(len(pages), 1)
+    return {
+        "backend": backend,
+        "output_format": output_format,
+        "pages": len(pages),
+        "profiles": len(all_records),
+        "pages_per_s": round(len(pages) / elapsed, 1) if elapsed else None,
+        "ms_per_page": {name: round(seconds * 1000 / page_count, 3) for name, seconds in timer.search_phases.items()},
+    }
+
+def print_offline_table(results):
+    phases = ["parse", "records", "save", "save_pandas"]
+    print(f"\n{'backend':<14}{'format':<9}{'pages/s':>9}{'profiles':>10}" + "".join(f"{p + ' ms':>15}" for p in phases))
+    for r in results:
+        print(f"{r['backend']:<14}{r['output_format']:<9}{r['pages_per_s']:>9.1f}{r['profiles']:>10}"
+              + "".join(f"{r['ms_per_page'].get(p, 0):>15.2f}" for p in phases))
+    print("(ms are per page; pages/s covers parse, records and save, not save_pandas)")
+
+def run_offline_benchmark(args):
+    pages = [html for html in load_offline_pages(args) if html]
+    if not pages:
+        print("No pages to benchmark.")
+        raise SystemExit(1)
+    print(f"Benchmarking {len(pages)} pages ({sum(len(html) for html in pages) / len(pages) / 1024:.0f} KB each on average)...")
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for backend in args.backend or PARSER_BACKENDS:
+            for output_format in args.output_format or ["csv"]:
+                try:
+                    results.append(benchmark_offline(pages, backend, output_format, workdir))
+                except ImportError as e: # e.g. selectolax or pyarrow not installed
+                    print(f"  Skipping {backend}/{output_format}: {e}")
+    if results:
+        print_offline_table(results)
+    return results
+
+# --- Main Execution Logic ---
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Scraper benchmarks.")
+    subcommands = arg_parser.add_subparsers(dest="command", required=True)
+
+    driver_parser = subcommands.add_parser("driver", help="Compare browser start-up, page load time and memory per browser setting")
+    driver_parser.add_argument("--url", action="append",
+                               help="URL to load (repeatable, default: the LinkedIn login page). "
+                                    "Search pages need a logged-in session.")
+    driver_parser.add_argument("--repeat", type=int, default=3, help="Loads per URL (default: %(default)s)")
+    driver_parser.add_argument("--all-toggles", action="store_true", help="Also measure each fast setting on its own")
+    driver_parser.add_argument("--json", metavar="FILE", help="Also write the results to a JSON file")
+
+    offline_parser = subcommands.add_parser("offline", help="Time parse, de-duplication and saving on saved pages (no browser)")
+    source = offline_parser.add_mutually_exclusive_group()
+    source.add_argument("--fixtures", metavar="DIR",
+                        help="Directory of .html / .html.gz result pages (default: the sanitized pages in fixtures/)")
+    source.add_argument("--page-cache", metavar="DIR", help="Use the newest pages of a page cache (see --page-cache in scraper.py)")
+    source.add_argument("--synthetic", type=int, metavar="N", help="Generate N LinkedIn-like pages instead")
+    offline_parser.add_argument("--backend", action="append", choices=PARSER_BACKENDS,
+                                help="Parser backend to measure (repeatable, default: all)")
+    offline_parser.add_argument("--output-format", action="append", choices=OUTPUT_FORMATS,
+                                help="Streaming output format to measure (repeatable, default: csv)")
+    offline_parser.add_argument("--json", metavar="FILE", help="Also write the results to a JSON file")
+
+    args = arg_parser.parse_args()
+    if args.command == "driver":
+        args.url = args.url or ["https://www.linkedin.com/login"]
+        benchmark_results = run_driver_benchmark(args)
+    elif args.command == "offline":
+        benchmark_results = run_offline_benchmark(args)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(benchmark_results, f, indent=2)
+        print(f"Results saved to '{args.json}'")
@@ -0,0 +1,432 @@
+# --- Imports ---
+import asyncio
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from session_store import LOGGED_OUT_MARKERS
+from selector_strategies import DEFAULT_STRATEGIES
+
+# Browser backends: what the scraper needs from a browser for one results page, behind the same
+# method names for every browser library. The result items are found with item_selectors, the CSS
+# selectors of the scraper's selector strategies (selector_strategies.py), tried in order.
+#   navigate(url)        - open a results page and wait until its results container (or an item) exists
+#   wait_for_results()   - scroll until every result item has rendered (adaptive or fixed waits)
+# (navigate and wait_for_results also take other selectors, e.g. for profile pages in enrich.py)
+#   get_results_html()   - HTML for profile_parser: the results container or the whole document
+#   get_result_rows()    - JSON string of [name, title, location, href] rows built in the browser
+#   next_page()          - click 'Next'; True if the next page loaded, False on the last page
+#   page_status()        - how the loaded page came back, one of PAGE_STATUSES (for rate_limiter)
+#   reload()             - load the current page again
+#   current_url          - URL of the page (property)
+# SeleniumBackend drives one Selenium tab with blocking calls. PlaywrightBackend drives one
+# Playwright page and its methods are coroutines, so many pages can load at the same time.
+BROWSER_BACKENDS = ('selenium', 'playwright')
+
+# --- Adaptive waiting ---
+# Elements that show a search results page has loaded (besides the result items themselves)
+RESULTS_CONTAINER_SELECTOR = "ul.reusable-search__entity-result-list, div.search-results-container"
+# Items the adaptive wait counts to decide whether the results have rendered, unless the scraper passes its own
+DEFAULT_ITEM_SELECTORS = [strategy["css"] for strategy in DEFAULT_STRATEGIES]
+NEXT_BUTTON_SELECTOR = 'button[aria-label="Next"]'
+POLL_INTERVAL = 0.1 # Seconds between checks of the page state
+NAVIGATION_TIMEOUT = 15 # Seconds to wait for a results container after opening a page
+# Installs (once per document) a MutationObserver that remembers when the DOM last changed,
+# then reports the number of result items, page height and milliseconds since the last change.
+RESULTS_STATE_JS = """
+if (!window.__scraperObserver && document.body) {
+    window.__scraperLastMutation = performance.now();
+    window.__scraperObserver = new MutationObserver(function () { window.__scraperLastMutation = performance.now(); });
+    window.__scraperObserver.observe(document.body, {childList: true, subtree: true});
+}
+return {
+    count: document.querySelectorAll(arguments[0]).length,
+    height: document.body ? document.body.scrollHeight : 0,
+    quiet: performance.now() - (window.__scraperLastMutation || 0),
+    ready: document.readyState === 'complete'
+};
+"""
+# Profile pages (enrich.py): ready once the name is there, fully rendered once the sections stop changing
+PROFILE_READY_SELECTOR = "main h1"
+PROFILE_SECTION_SELECTOR = "main section"
+PROFILE_MAIN_JS = "var main = document.querySelector('main'); return main ? main.outerHTML : document.documentElement.outerHTML;"
+SCROLL_TO_BOTTOM_JS = "window.scrollTo(0, document.body.scrollHeight);"
+PAGE_HEIGHT_JS = "return document.body.scrollHeight"
+
+# --- Page status (throttle/challenge detection) ---
+#   'ok'         - result items (or, for profiles, the ready selector) are on the page
+#   'no_results' - LinkedIn says there are no results: a genuine end of the search
+#   'empty'      - nothing rendered and no 'no results' message (often a soft block or a slow page)
+#   'challenge'  - security check / captcha / login wall instead of the page
+#   'throttled'  - HTTP 429 or LinkedIn's search limit page
+PAGE_STATUSES = ('ok', 'no_results', 'empty', 'challenge', 'throttled')
+RETRY_STATUSES = ('empty', 'challenge', 'throttled') # Loaded again after slowing down before giving up
+BLOCKED_STATUSES = ('challenge', 'throttled') # Never taken for the end of a search
+PAGE_STATUS_TEXT = {
+    'ok': "loaded",
+    'no_results': "a 'no results' page",
+    'empty': "empty (no results and no 'no results' message)",
+    'challenge': "a security check / login wall",
+    'throttled': "rate limited (HTTP 429 or search limit)",
+}
+# Result items mean the page is fine, whatever its text says (a profile headline can mention
+# 'Too Many Requests'); the text heuristics only decide what an item-less page is.
+PAGE_STATUS_JS = """
+if (document.querySelector(arguments[0])) { return 'ok'; }
+var text = (document.title || '') + ' ' + (document.body ? document.body.innerText.slice(0, 5000) : '');
+if (/HTTP ERROR 429|Too Many Requests|commercial use limit/i.test(text)) { return 'throttled'; }
+if (document.querySelector('#captcha-internal, iframe[src*="captcha"], form[action*="checkpoint"]') ||
+    /security verification|quick security check|unusual activity/i.test(text)) { return 'challenge'; }
+if (document.querySelector('.search-reusables__no-results-message, .search-no-results') ||
+    /No results found/i.test(text)) { return 'no_results'; }
+return 'empty';
+"""
+
+# --- Extraction modes (what gets sent back from the browser for each page) ---
+#   'page_source' - the whole document (original behaviour)
+#   'container'   - only the outerHTML of the results list/container
+#   'json'        - name/title/location/URL already extracted in the browser
+EXTRACTION_MODES = ('page_source', 'container', 'json')
+# Returns the outerHTML of the smallest element whose HTML, parsed on its own, still matches every
+# result item, so profile_parser finds the same items in it; null if there is none. Like
+# profile_parser, only the first of the item selectors (arguments[0]) that matches anything is used,
+# so a stray element matching a generic selector cannot stretch the container up to <body>.
+RESULTS_CONTAINER_JS = """
+var items = [], selector = null;
+for (var i = 0; i < arguments[0].length && !items.length; i++) {
+    selector = arguments[0][i];
+    items = document.querySelectorAll(selector);
+}
+if (!items.length) {
+    var container = document.querySelector('div.search-results-container');
+    return container ? container.outerHTML : null;
+}
+var node = items[0].parentElement;
+while (node && node !== document.documentElement) {
+    if (Array.prototype.every.call(items, function (item) { return node.contains(item); })) {
+        var copy = document.createElement('template');
+        copy.innerHTML = node.outerHTML;
+        if (copy.content.querySelectorAll(selector).length === items.length) { return node.outerHTML; }
+    }
+    node = node.parentElement;
+}
+return null;
+"""
+# Same selectors as profile_parser (arguments[0]: the item selectors, first match wins), run in the
+# browser. Returns a JSON string of [name, title, location, href] rows.
+EXTRACT_ROWS_JS = """
+var items = [];
+for (var i = 0; i < arguments[0].length && !items.length; i++) { items = document.querySelectorAll(arguments[0][i]); }
+function text(el) { return el ? el.textContent.trim() : null; }
+var rows = [];
+items.forEach(function (item) {
+    var link = item.querySelector('span.entity-result__title-text a.app-aware-link');
+    var name = null, href = null;
+    if (link) {
+        href = link.getAttribute('href') || '';
+        name = text(link.querySelector('span[aria-hidden="true"]') || link);
+    }
+    var title = item.querySelector('div.entity-result__primary-subtitle') || item.querySelector('p.entity-result__summary');
+    rows.push([name, text(title), text(item.querySelector('div.entity-result__secondary-subtitle')), href]);
+});
+return JSON.stringify(rows);
+"""
+
+class SettleCheck:
+    """
+    Decision logic of the adaptive wait, shared by both backends. Feed it the RESULTS_STATE_JS
+    result of every poll: update() returns whether to scroll and whether the wait is over.
+    """
+    def __init__(self, max_wait, quiet_period):
+        self.started = time.monotonic()
+        self.deadline = self.started + max_wait
+        self.max_wait = max_wait
+        self.quiet_ms = quiet_period * 1000
+        self.last_count = -1
+        self.last_height = None
+
+    def update(self, state):
+        """Returns (scroll, result): result is None to keep polling, True if settled, False on timeout."""
+        scroll = state['height'] != self.last_height # New content pushed the page down, keep scrolling
+        self.last_height = state['height']
+        count_stable = state['count'] == self.last_count
+        self.last_count = state['count']
+        elapsed = time.monotonic() - self.started
+        if count_stable and state['quiet'] >= self.quiet_ms:
+            if state['count'] > 0:
+                print(f"{state['count']} result items rendered after {elapsed:.1f}s.")
+                return scroll, True
+            if state['ready'] and state['quiet'] >= self.quiet_ms * 4: # Nothing is changing and nothing is there
+                print(f"Page settled with no result items after {elapsed:.1f}s.")
+                return scroll, True
+        if time.monotonic() >= self.deadline:
+            print(f"Reached max wait of {self.max_wait}s with {state['count']} result items rendered.")
+            return scroll, False
+        return scroll, None
+
+class SeleniumBackend:
+    def __init__(self, driver, wait_mode='adaptive', max_wait=15, quiet_period=0.5, extraction_mode='container',
+                 item_selectors=None):
+        self.driver = driver
+        self.wait_mode = wait_mode # 'adaptive' (return as soon as results render) or 'fixed' (original sleeps)
+        self.max_wait = max_wait # Ceiling in seconds for the adaptive waits
+        self.quiet_period = quiet_period # Seconds without DOM changes before a page counts as fully rendered
+        self.extraction_mode = extraction_mode # See EXTRACTION_MODES
+        self.item_selectors = list(item_selectors or DEFAULT_ITEM_SELECTORS) # In the order profile_parser tries them
+        self.item_selector = ", ".join(self.item_selectors) # Any result item
+        self.ready_selector = f"{RESULTS_CONTAINER_SELECTOR}, {self.item_selector}" # A results page has loaded
+        self.wait = WebDriverWait(driver, NAVIGATION_TIMEOUT) # Standard wait timeout
+
+    @property
+    def current_url(self):
+        return self.driver.current_url
+
+    def navigate(self, url, ready_selector=None):
+        self.driver.get(url)
+        # Wait for a key element of the results page to appear
+        self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector or self.ready_selector)))
+
+    def reload(self):
+        self.driver.refresh()
+
+    def wait_for_tab(self):
+        """Waits until a tab opened with window.open (which starts on about:blank) has loaded its URL."""
+        self.wait.until(lambda d: d.current_url != 'about:blank' and
+                        d.execute_script("return document.readyState") != 'loading')
+
+    def page_status(self, item_selector=None):
+        """Classifies the page in this tab, see PAGE_STATUSES."""
+        if any(marker in self.driver.current_url for marker in LOGGED_OUT_MARKERS):
+            return 'challenge'
+        return self.driver.execute_script(PAGE_STATUS_JS, item_selector or self.item_selector)
+
+    def wait_for_results(self, item_selector=None):
+        """Scrolls until the results have rendered. Returns True if the page settled in time."""
+        if self.wait_mode == 'adaptive':
+            return self.wait_for_results_rendered(item_selector)
+        self.scroll_fixed()
+        return True
+
+    def scroll_fixed(self):
+        """Original scrolling logic: fixed 2.5 s sleeps until the page height stops changing."""
+        print("Scrolling down page...")
+        last_height = self.driver.execute_script(PAGE_HEIGHT_JS)
+        scroll_attempts = 0
+        max_scroll_attempts = 5 # Increased attempts for potentially slow loading pages
+        stable_count = 0 # Counter for consecutive stable scrolls
+        while scroll_attempts < max_scroll_attempts:
+            self.driver.execute_script(SCROLL_TO_BOTTOM_JS)
+            time.sleep(2.5) # Wait for content to potentially load after scroll
+            new_height = self.driver.execute_script(PAGE_HEIGHT_JS)
+            if new_height == last_height:
+                stable_count += 1
+                if stable_count >= 2: # Consider it stable if height doesn't change for 2 checks
+                     print("Scroll height stabilized.")
+                     break
+            else:
+                last_height = new_height
+                stable_count = 0 # Reset counter if height changes
+            scroll_attempts += 1
+            if scroll_attempts == max_scroll_attempts:
+                print("Max scroll attempts reached.")
+        time.sleep(1) # Final short pause
+
+    def wait_for_results_rendered(self, item_selector=None):
+        """
+        Adaptive scrolling: scrolls to the bottom and returns as soon as the result items are
+        rendered and the page has been quiet (no DOM mutations) for quiet_period seconds.
+        Never waits longer than max_wait seconds. Returns True if the page settled in time.
+        """
+        check = SettleCheck(self.max_wait, self.quiet_period)
+        while True:
+            scroll, settled = check.update(self.driver.execute_script(RESULTS_STATE_JS, item_selector or self.item_selector))
+            if scroll:
+                self.driver.execute_script(SCROLL_TO_BOTTOM_JS)
+            if settled is not None:
+                return settled
+            time.sleep(POLL_INTERVAL)
+
+    def get_results_html(self):
+        """Returns the HTML to parse for the current page: the whole document or just the results container."""
+        if self.extraction_mode == 'container':
+            html = self.driver.execute_script(RESULTS_CONTAINER_JS, self.item_selectors)
+            if html:
+                return html
+            print("Results container not found, falling back to the full page source.")
+        return self.driver.page_source
+
+    def get_result_rows(self):
+        return self.driver.execute_script(EXTRACT_ROWS_JS, self.item_selectors)
+
+    def wait_for_next_page(self, old_url, old_item=None):
+        """Waits after clicking 'Next' until the results list has been replaced (adaptive) or a fixed 2 s (fixed)."""
+        if self.wait_mode != 'adaptive':
+            time.sleep(2) # Give it a moment to start loading
+            return
+        try:
+            # The old first result going stale, or the URL changing, means the next page is rendering
+            WebDriverWait(self.driver, self.max_wait, poll_frequency=POLL_INTERVAL).until(
+                lambda d: d.current_url != old_url or (old_item is not None and EC.staleness_of(old_item)(d)))
+        except TimeoutException:
+            print(f"Results did not change within {self.max_wait}s after clicking 'Next'.")
+
+    def next_page(self):
+        """
+        Clicks the 'Next' button and waits for the next page of results.
+        Returns True if the next page loaded, False if this was the last page.
+        Other errors are raised to the caller.
+        """
+        try:
+            # Use presence check first, then check if clickable, more robust
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, NEXT_BUTTON_SELECTOR)))
+            next_button = self.driver.find_element(By.CSS_SELECTOR, NEXT_BUTTON_SELECTOR)
+
+            # Check if the button is disabled (often indicates the last page)
+            if next_button.get_attribute("disabled"):
+                 print("Next button is disabled. Reached the last available page.")
+                 return False
+
+            # Scroll the button into view slightly before clicking (can help)
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
+            if self.wait_mode != 'adaptive':
+                time.sleep(0.5) # Short pause after scroll (not needed for the JS click below)
+
+            # Remember the current page so we can tell when it has been replaced
+            old_url = self.driver.current_url
+            old_items = self.driver.find_elements(By.CSS_SELECTOR, self.item_selector)
+
+            # Wait until the button is truly clickable
+            next_button_clickable = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, NEXT_BUTTON_SELECTOR)))
+            print("Found 'Next' button, clicking...")
+            self.driver.execute_script("arguments[0].click();", next_button_clickable) # Use JS click for reliability
+
+            # --- Wait for Next Page Load Indicator ---
+            print("Waiting for next page to load...")
+            # It's hard to find a perfect universal indicator. Waiting for the old results
+            # to go stale (or the URL to change) and for a results container element works well.
+            self.wait_for_next_page(old_url, old_items[0] if old_items else None)
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.ready_selector)))
+            print("Next page appears to be loaded.")
+            return True
+
+        except TimeoutException:
+            print("No 'Next' button found, clickable, or page didn't load within timeout. Assuming last page reached.")
+            return False
+        except NoSuchElementException:
+            print("No 'Next' button element found. Reached the last available page.")
+            return False
+
+def playwright_script(js):
+    """Turns a Selenium-style script body (uses 'return' and arguments[i]) into a Playwright page.evaluate function."""
+    return f"(args) => (function () {{ {js} }}).apply(null, args)"
+
+class PlaywrightBackend:
+    def __init__(self, page, wait_mode='adaptive', max_wait=15, quiet_period=0.5, extraction_mode='container',
+                 wait_until='load', item_selectors=None):
+        self.page = page # playwright.async_api.Page
+        self.wait_mode = wait_mode
+        self.max_wait = max_wait
+        self.quiet_period = quiet_period
+        self.extraction_mode = extraction_mode
+        self.wait_until = wait_until # 'load', or 'domcontentloaded' for the eager page load strategy
+        self.item_selectors = list(item_selectors or DEFAULT_ITEM_SELECTORS) # Same as SeleniumBackend
+        self.item_selector = ", ".join(self.item_selectors)
+        self.ready_selector = f"{RESULTS_CONTAINER_SELECTOR}, {self.item_selector}"
+        self.http_status = None # Status of the last navigation's response (Selenium cannot see it)
+
+    @property
+    def current_url(self):
+        return self.page.url
+
+    async def evaluate(self, js, *args):
+        return await self.page.evaluate(playwright_script(js), list(args))
+
+    async def navigate(self, url, ready_selector=None):
+        response = await self.page.goto(url, wait_until=self.wait_until, timeout=NAVIGATION_TIMEOUT * 1000)
+        self.http_status = response.status if response else None
+        if self.http_status == 429:
+            return # No results will come; page_status() reports it
+        await self.page.wait_for_selector(ready_selector or self.ready_selector, state="attached", timeout=NAVIGATION_TIMEOUT * 1000)
+
+    async def reload(self):
+        response = await self.page.reload(wait_until=self.wait_until, timeout=NAVIGATION_TIMEOUT * 1000)
+        self.http_status = response.status if response else None
+
+    async def page_status(self, item_selector=None):
+        """Classifies the page, see PAGE_STATUSES. Unlike Selenium, a 429 response is seen directly."""
+        if self.http_status == 429:
+            return 'throttled'
+        if any(marker in self.page.url for marker in LOGGED_OUT_MARKERS):
+            return 'challenge'
+        return await self.evaluate(PAGE_STATUS_JS, item_selector or self.item_selector)
+
+    async def wait_for_results(self, item_selector=None):
+        """Scrolls until the results have rendered. Returns True if the page settled in time."""
+        if self.wait_mode != 'adaptive':
+            await self.scroll_fixed()
+            return True
+        check = SettleCheck(self.max_wait, self.quiet_period)
+        while True:
+            scroll, settled = check.update(await self.evaluate(RESULTS_STATE_JS, item_selector or self.item_selector))
+            if scroll:
+                await self.evaluate(SCROLL_TO_BOTTOM_JS)
+            if settled is not None:
+                return settled
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def scroll_fixed(self):
+        """Same fixed sleeps as SeleniumBackend.scroll_fixed, without blocking the other pages."""
+        last_height = await self.evaluate(PAGE_HEIGHT_JS)
+        stable_count = 0
+        for _ in range(5):
+            await self.evaluate(SCROLL_TO_BOTTOM_JS)
+            await asyncio.sleep(2.5)
+            new_height = await self.evaluate(PAGE_HEIGHT_JS)
+            if new_height == last_height:
+                stable_count += 1
+                if stable_count >= 2:
+                    break
+            else:
+                last_height = new_height
+                stable_count = 0
+        await asyncio.sleep(1)
+
+    async def get_results_html(self):
+        if self.extraction_mode == 'container':
+            html = await self.evaluate(RESULTS_CONTAINER_JS, self.item_selectors)
+            if html:
+                return html
+            print("Results container not found, falling back to the full page source.")
+        return await self.page.content()
+
+    async def get_result_rows(self):
+        return await self.evaluate(EXTRACT_ROWS_JS, self.item_selectors)
+
+    async def next_page(self):
+        """Clicks 'Next' and waits for the results to be replaced. Returns False on the last page."""
+        button = self.page.locator(NEXT_BUTTON_SELECTOR)
+        try:
+            await button.first.wait_for(state="attached", timeout=NAVIGATION_TIMEOUT * 1000)
+        except Exception: # playwright's TimeoutError
+            print("No 'Next' button found. Reached the last available page.")
+            return False
+        if await button.first.is_disabled():
+            print("Next button is disabled. Reached the last available page.")
+            return False
+        old_url = self.page.url
+        old_item = await self.page.query_selector(self.item_selector)
+        print("Found 'Next' button, clicking...")
+        self.http_status = None # The click's own response is not seen; page_status() reads the page instead
+        await button.first.click()
+        if self.wait_mode != 'adaptive':
+            await asyncio.sleep(2)
+        deadline = time.monotonic() + self.max_wait
+        while time.monotonic() < deadline: # URL changed or old first result removed = next page is rendering
+            if self.page.url != old_url or (old_item is not None and not await old_item.evaluate("el => el.isConnected")):
+                break
+            await asyncio.sleep(POLL_INTERVAL)
+        else:
+            print(f"Results did not change within {self.max_wait}s after clicking 'Next'.")
+        await self.page.wait_for_selector(self.ready_selector, state="attached", timeout=NAVIGATION_TIMEOUT * 1000)
+        return True
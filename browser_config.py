@@ -0,0 +1,127 @@
+# --- Imports ---
+import fnmatch
+import re
+from selenium import webdriver
+
+# Browser settings used to start Chrome. Every setting can be switched on or off on its own.
+#   headless            - no visible window (much less CPU/memory; 2FA must be done beforehand)
+#   page_load_strategy  - 'normal' waits for every image/font, 'eager' returns once the DOM is ready
+#   block_resources     - block images, media, fonts and analytics/tracking requests (via CDP)
+#   disable_extensions  - start Chrome without extensions
+#   disable_gpu         - no GPU process (saves memory, not needed for scraping)
+DEFAULT_BROWSER_SETTINGS = {
+    "headless": False,
+    "page_load_strategy": "normal",
+    "block_resources": False,
+    "disable_extensions": False,
+    "disable_gpu": False,
+}
+FAST_BROWSER_SETTINGS = {
+    "headless": True,
+    "page_load_strategy": "eager",
+    "block_resources": True,
+    "disable_extensions": True,
+    "disable_gpu": True,
+}
+
+# URL patterns (Chrome's Network.setBlockedURLs wildcard syntax) that the scraper never needs
+BLOCKED_URL_PATTERNS = [
+    # Images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*media.licdn.com/dms/image/*",
+    # Video / audio
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist/*",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Analytics and trackers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*bat.bing.com*",
+    "*connect.facebook.net*", "*px.ads.linkedin.com*", "*snap.licdn.com*", "*linkedin.com/li/track*",
+]
+
+def resolve_browser_settings(settings=None):
+    """Fills in missing keys of a (partial) settings dict from the defaults."""
+    resolved = dict(DEFAULT_BROWSER_SETTINGS)
+    resolved.update(settings or {})
+    return resolved
+
+def build_chrome_options(settings=None):
+    """Returns selenium ChromeOptions for the given browser settings."""
+    settings = resolve_browser_settings(settings)
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = settings["page_load_strategy"]
+    if settings["headless"]:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080") # Desktop layout, same results per page as a normal window
+    if settings["disable_extensions"]:
+        options.add_argument("--disable-extensions")
+    if settings["disable_gpu"]:
+        options.add_argument("--disable-gpu")
+    if settings["block_resources"]:
+        # Also stop images at the renderer level, in case a request slips past the URL patterns
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+def block_resources(driver, patterns=None):
+    """Tells Chrome (through the DevTools protocol) to block requests matching the patterns."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
+
+def create_chrome_driver(settings=None):
+    """Starts Chrome with the given browser settings (ChromeDriver must be accessible)."""
+    settings = resolve_browser_settings(settings)
+    driver = webdriver.Chrome(options=build_chrome_options(settings))
+    if settings["block_resources"]:
+        block_resources(driver)
+    return driver
+
+def blocked_url_regex(patterns=None):
+    """Compiles the Chrome-style wildcard patterns into one regex (for browsers without Network.setBlockedURLs)."""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns or BLOCKED_URL_PATTERNS))
+
+async def create_playwright_context(settings=None):
+    """
+    Starts Playwright's Chromium with the given browser settings and opens one browser context.
+    Returns (playwright, browser, context); close them in reverse order. Needs pip install playwright
+    and playwright install chromium.
+    """
+    from playwright.async_api import async_playwright # Optional, only needed for --browser-backend playwright
+    settings = resolve_browser_settings(settings)
+    args = []
+    if settings["disable_extensions"]:
+        args.append("--disable-extensions")
+    if settings["disable_gpu"]:
+        args.append("--disable-gpu")
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=settings["headless"], args=args)
+        context = await browser.new_context(viewport={"width": 1920, "height": 1080}) # Desktop layout
+    except Exception:
+        await playwright.stop()
+        raise
+    if settings["block_resources"]:
+        blocked = blocked_url_regex()
+        async def route(route):
+            if route.request.resource_type in ("image", "media", "font") or blocked.match(route.request.url):
+                await route.abort()
+            else:
+                await route.continue_()
+        await context.route("**/*", route)
+    return playwright, browser, context
+
+def browser_memory_mb(driver):
+    """Total resident memory (MB) of ChromeDriver and every Chrome process it started, or None without psutil."""
+    try:
+        import psutil # Optional (pip install psutil)
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error: # Process exited while we were counting
+            pass
+    return total / (1024 * 1024)
@@ -0,0 +1,99 @@
+# --- Imports ---
+import argparse
+import os
+import time
+from scraper import create_scraper, add_scraper_arguments, scraper_options, rate_limiter_from_args
+from batch import get_credentials
+from profile_parser import parse_profile_details, DETAIL_COLUMNS
+from profile_store import ProfileStore, normalize_profile_url
+from output_writers import open_writer, output_path, read_output, OUTPUT_FORMATS
+
+# Second stage after scraping searches: visits every collected profile and adds its headline,
+# current company, about text and experience (see profile_parser.parse_profile_details).
+# Usage: python enrich.py people.csv [more result files] --output people_enriched.csv
+#        [--store linkedin_profiles.db] [--max-age-days 30] [--parallel-pages 3] [--browser-backend playwright]
+#
+# Each profile's fields are saved in the profile store as soon as they are fetched. Profiles
+# enriched less than --max-age-days ago (in this or any earlier job) come from the store instead
+# of the browser, so an interrupted job resumes where it stopped when run again, and profiles
+# appearing in several searches are only fetched once.
+
+DEFAULT_STORE = "linkedin_profiles.db"
+
+def read_profiles(paths):
+    """Reads result files (csv/jsonl/parquet, by extension) and returns their rows, one per profile."""
+    rows = {}
+    for path in paths:
+        extension = os.path.splitext(path)[1].lstrip(".").lower()
+        output_format = extension if extension in OUTPUT_FORMATS else "csv"
+        frame = read_output(path, output_format)
+        frame = frame.astype(object).where(frame.notna(), None) # NaN -> None, so rows stay JSON-friendly
+        for row in frame.to_dict("records"):
+            key = normalize_profile_url(row.get("Profile URL"))
+            if key and key not in rows:
+                rows[key] = row
+    return rows
+
+def enriched_row(row, details):
+    """The search result row with the enrichment columns added (empty when details is None)."""
+    details = details or {}
+    return dict(row, **{column: details.get(column) for column in DETAIL_COLUMNS})
+
+# --- Main Execution Logic ---
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Add headline, company, about and experience to scraped profiles.")
+    arg_parser.add_argument("inputs", nargs="+", help="Result files written by scraper.py or batch.py")
+    arg_parser.add_argument("--output", default="profiles_enriched.csv",
+                            help="Where to write the enriched profiles; the extension follows --output-format (default: %(default)s)")
+    arg_parser.add_argument("--max-age-days", type=float, default=30,
+                            help="Re-fetch profiles enriched longer ago than this (default: %(default)s)")
+    arg_parser.add_argument("--limit", type=int, help="Fetch at most this many profiles in this run")
+    add_scraper_arguments(arg_parser) # --parallel-pages sets how many profiles load at the same time
+    args = arg_parser.parse_args()
+
+    profiles = read_profiles(args.inputs)
+    store = ProfileStore(args.store or DEFAULT_STORE)
+    cached = store.get_details(profiles.keys(), args.max_age_days * 24 * 3600)
+    to_fetch = [key for key in profiles if key not in cached]
+    if args.limit is not None:
+        to_fetch = to_fetch[:args.limit]
+    print(f"{len(profiles)} profiles: {len(cached)} already enriched (store '{store.path}'), {len(to_fetch)} to fetch.")
+
+    path = output_path(args.output, args.output_format)
+    writer = open_writer(path, args.output_format)
+    writer.write_rows([enriched_row(profiles[key], cached[key]) for key in profiles if key in cached])
+
+    scraper = None
+    fetched = failed = 0
+    started = time.time()
+    try:
+        if to_fetch:
+            username, password = get_credentials()
+            scraper = create_scraper(username, password, rate_limiter=rate_limiter_from_args(args), **scraper_options(args))
+            scraper.login()
+            for url, html, error in scraper.fetch_profile_pages([profiles[key]["Profile URL"] for key in to_fetch]):
+                details = parse_profile_details(html) if html else None
+                if not details or not details["Name"]: # Login wall, removed profile or not loaded in time
+                    failed += 1
+                    print(f"  Could not enrich {url}: {error or 'no profile found on the page'}")
+                    continue
+                store.save_details(url, details)
+                writer.write_rows([enriched_row(profiles[normalize_profile_url(url)], details)])
+                fetched += 1
+                if fetched % 25 == 0:
+                    elapsed = time.time() - started
+                    print(f"  {fetched}/{len(to_fetch)} profiles enriched ({fetched / elapsed * 60:.1f} profiles/min)")
+    except KeyboardInterrupt:
+        print("\n[INFO] KeyboardInterrupt detected. Everything fetched so far is saved; run again to continue.")
+    finally:
+        writer.close()
+        if scraper:
+            scraper.close()
+        store.close()
+    elapsed = time.time() - started
+    print(f"\nEnriched {fetched} profiles in {elapsed:.0f}s ({failed} failed, {len(cached)} from the store). "
+          f"Saved {writer.rows_written} rows to '{path}'.")
+    if scraper:
+        print(f"Rate limiter: {scraper.limiter.summary()}")
+    if failed:
+        print("Failed profiles are not stored and will be tried again on the next run.")
@@ -0,0 +1,177 @@
+# --- Imports ---
+import csv
+import json
+import os
+import glob
+
+try:
+    import pyarrow as pa # Optional, only needed for Parquet output (pip install pyarrow)
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Streaming output: rows are written as soon as each page is parsed instead of being kept in
+# memory until the end of the search, and a small checkpoint file records how far the search got.
+OUTPUT_FORMATS = ('csv', 'jsonl', 'parquet')
+DEFAULT_COLUMNS = ["Name", "Title", "Location", "Profile URL"]
+
+def output_path(filename, output_format):
+    """Swaps the extension of filename for the one of output_format ('people.csv' -> 'people.jsonl')."""
+    base, _ = os.path.splitext(filename)
+    return f"{base}.{output_format}"
+
+class CsvStreamWriter:
+    """Appends rows to a CSV file, writing the header only once."""
+    def __init__(self, path, append=False):
+        self.path = path
+        self.pending_rows = 0 # Rows written but not yet on disk (always 0, every page is flushed)
+        self.rows_written = 0
+        self.columns = None
+        if append and os.path.isfile(path) and os.path.getsize(path) > 0:
+            with open(path, newline='', encoding='utf-8') as f:
+                self.columns = next(csv.reader(f), None) # Keep the existing header when resuming
+            self.file = open(path, 'a', newline='', encoding='utf-8')
+        else:
+            self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = None
+
+    def write_rows(self, rows):
+        if not rows:
+            return
+        if self.writer is None:
+            self.columns = self.columns or list(rows[0].keys())
+            self.writer = csv.DictWriter(self.file, fieldnames=self.columns, extrasaction='ignore', restval='')
+            if self.file.tell() == 0:
+                self.writer.writeheader()
+        self.writer.writerows(rows)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.rows_written += len(rows)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+class JsonlStreamWriter:
+    """Appends one JSON object per line."""
+    def __init__(self, path, append=False):
+        self.path = path
+        self.pending_rows = 0
+        self.rows_written = 0
+        self.file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write_rows(self, rows):
+        if not rows:
+            return
+        self.file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.rows_written += len(rows)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+class ParquetStreamWriter:
+    """
+    Buffers rows and writes every batch_size rows as a separate part file inside a directory
+    (e.g. people.parquet/part-00000.parquet). Each part is a complete Parquet file, so nothing
+    already written is lost if the process dies, and pandas/pyarrow read the directory as one table.
+    """
+    def __init__(self, path, append=False, batch_size=500):
+        if pq is None:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow")
+        self.path = path
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self.buffer = []
+        os.makedirs(path, exist_ok=True)
+        existing = sorted(glob.glob(os.path.join(path, "part-*.parquet")))
+        if not append:
+            for part in existing:
+                os.remove(part)
+            existing = []
+        self.next_part = len(existing)
+
+    @property
+    def pending_rows(self):
+        return len(self.buffer)
+
+    def write_rows(self, rows):
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        columns = list(DEFAULT_COLUMNS) + [key for key in self.buffer[0] if key not in DEFAULT_COLUMNS]
+        table = pa.Table.from_pylist(self.buffer, schema=pa.schema(
+            [(column, pa.bool_() if column == "Seen Before" else pa.string()) for column in columns]))
+        part_path = os.path.join(self.path, f"part-{self.next_part:05d}.parquet")
+        pq.write_table(table, part_path + ".tmp")
+        os.replace(part_path + ".tmp", part_path) # Never leave a half-written part behind
+        self.next_part += 1
+        self.rows_written += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+
+def open_writer(path, output_format, append=False):
+    if output_format == 'csv':
+        return CsvStreamWriter(path, append)
+    if output_format == 'jsonl':
+        return JsonlStreamWriter(path, append)
+    if output_format == 'parquet':
+        return ParquetStreamWriter(path, append)
+    raise ValueError(f"Unknown output format '{output_format}'. Choose one of: {', '.join(OUTPUT_FORMATS)}")
+
+def read_output(path, output_format):
+    """Reads a file written by one of the writers above (or save_to_csv) into a pandas DataFrame."""
+    import pandas as pd # Only needed here, keeps the writers usable without pandas
+    if output_format == 'csv':
+        return pd.read_csv(path)
+    if output_format == 'jsonl':
+        return pd.read_json(path, lines=True)
+    if output_format == 'parquet':
+        return pd.read_parquet(path)
+    raise ValueError(f"Unknown output format '{output_format}'. Choose one of: {', '.join(OUTPUT_FORMATS)}")
+
+class SearchCheckpoint:
+    """
+    Small JSON file next to the output ('people.csv.checkpoint.json') recording the search URL,
+    the last page whose rows are safely on disk and the profile URLs already collected,
+    so an interrupted search can continue from the next page.
+    """
+    def __init__(self, output_file):
+        self.path = output_file + ".checkpoint.json"
+
+    def load(self, search_url):
+        """Returns the saved state for search_url, or None if there is nothing to resume."""
+        if not os.path.isfile(self.path):
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring unreadable checkpoint '{self.path}': {e}")
+            return None
+        if state.get("search_url") != search_url or state.get("completed"):
+            return None
+        return state
+
+    def save(self, search_url, last_completed_page, seen_keys, profiles_written, completed=False):
+        state = {
+            "search_url": search_url,
+            "last_completed_page": last_completed_page,
+            "profiles_written": profiles_written,
+            "completed": completed,
+            "seen_urls": sorted(seen_keys),
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path) # Atomic: a crash never leaves a half-written checkpoint
@@ -0,0 +1,129 @@
+# --- Imports ---
+import gzip
+import hashlib
+import os
+import sqlite3
+import time
+
+# On-disk cache of the raw HTML captured for every results page. When LinkedIn changes its markup
+# and fields come back empty, fix the selectors and run reextract.py to rebuild the outputs from
+# the cache in seconds, instead of scraping everything again through the browser.
+#
+# Layout: <cache dir>/index.db (SQLite index) and <cache dir>/<2 hex chars>/<key>.html.gz
+# Each entry is keyed by search URL + page number + a hash of the HTML, so re-capturing a page
+# with different content adds a new entry and identical content is stored only once.
+
+class PageCache:
+    def __init__(self, directory="page_cache", max_bytes=500 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes # Oldest-used pages are deleted once the cache grows past this
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(directory, "index.db"))
+        self.conn.execute("PRAGMA journal_mode=WAL") # Several workers may share one cache
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                cache_key TEXT PRIMARY KEY,
+                search_url TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                output_file TEXT,
+                size INTEGER NOT NULL,
+                captured_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_pages_search ON pages (search_url, page, captured_at);
+            CREATE INDEX IF NOT EXISTS idx_pages_access ON pages (last_access);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(search_url, page, content_hash):
+        return hashlib.sha256(f"{search_url}\n{page}\n{content_hash}".encode("utf-8")).hexdigest()
+
+    def _path(self, cache_key):
+        return os.path.join(self.directory, cache_key[:2], cache_key + ".html.gz")
+
+    def put(self, search_url, page, html, output_file=None):
+        """Stores the HTML captured for one page. Returns the cache key."""
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        cache_key = self.make_key(search_url, page, content_hash)
+        now = time.time()
+        with self.conn:
+            updated = self.conn.execute(
+                "UPDATE pages SET captured_at = ?, last_access = ?, output_file = COALESCE(?, output_file) WHERE cache_key = ?",
+                (now, now, output_file, cache_key)).rowcount
+            if updated: # Same page, same content: already cached
+                return cache_key
+            path = self._path(cache_key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            compressed = gzip.compress(data, compresslevel=6)
+            with open(path + ".tmp", "wb") as f:
+                f.write(compressed)
+            os.replace(path + ".tmp", path)
+            self.conn.execute(
+                "INSERT INTO pages (cache_key, search_url, page, content_hash, output_file, size, captured_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, search_url, page, content_hash, output_file, len(compressed), now, now))
+        self.evict()
+        return cache_key
+
+    def read(self, cache_key):
+        """Returns the HTML of an entry (and marks it as recently used), or None if it is gone."""
+        try:
+            with gzip.open(self._path(cache_key), "rb") as f:
+                html = f.read().decode("utf-8")
+        except FileNotFoundError:
+            with self.conn:
+                self.conn.execute("DELETE FROM pages WHERE cache_key = ?", (cache_key,))
+            return None
+        with self.conn:
+            self.conn.execute("UPDATE pages SET last_access = ? WHERE cache_key = ?", (time.time(), cache_key))
+        return html
+
+    def get(self, search_url, page):
+        """Returns the most recently captured HTML for a page of a search, or None."""
+        row = self.conn.execute(
+            "SELECT cache_key FROM pages WHERE search_url = ? AND page = ? ORDER BY captured_at DESC LIMIT 1",
+            (search_url, page)).fetchone()
+        return self.read(row[0]) if row else None
+
+    def searches(self):
+        """Returns (search_url, output_file, page count) for every cached search."""
+        return self.conn.execute(
+            "SELECT search_url, MAX(output_file), COUNT(DISTINCT page) FROM pages GROUP BY search_url ORDER BY MIN(captured_at)"
+        ).fetchall()
+
+    def latest_pages(self, search_url):
+        """Returns [(page, cache_key)] with the newest capture of each page of a search, in page order."""
+        return self.conn.execute(
+            "SELECT page, cache_key FROM pages p WHERE search_url = ? AND captured_at = "
+            "(SELECT MAX(captured_at) FROM pages WHERE search_url = p.search_url AND page = p.page) ORDER BY page",
+            (search_url,)).fetchall()
+
+    def total_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+    def evict(self):
+        """Deletes least recently used entries until the cache is within max_bytes."""
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        removed = 0
+        with self.conn:
+            for cache_key, size in self.conn.execute("SELECT cache_key, size FROM pages ORDER BY last_access").fetchall():
+                if excess <= 0:
+                    break
+                try:
+                    os.remove(self._path(cache_key))
+                except FileNotFoundError:
+                    pass
+                self.conn.execute("DELETE FROM pages WHERE cache_key = ?", (cache_key,))
+                excess -= size
+                removed += 1
+        print(f"Page cache: evicted {removed} least recently used pages to stay under {self.max_bytes / (1024 * 1024):.0f} MB.")
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
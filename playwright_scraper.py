@@ -0,0 +1,354 @@
+# --- Imports ---
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from browser_backends import (PlaywrightBackend, playwright_script, PROFILE_READY_SELECTOR, PROFILE_SECTION_SELECTOR,
+                              PROFILE_MAIN_JS, BLOCKED_STATUSES, PAGE_STATUS_TEXT)
+from browser_config import create_playwright_context, resolve_browser_settings
+from scraper import LinkedInScraper, PageBlockedError, build_page_url
+from session_store import (load_session, write_session, session_cookies, PLAYWRIGHT_COOKIE_FIELDS, VERIFY_URL,
+                           LOGGED_OUT_MARKERS, READ_LOCAL_STORAGE_JS, WRITE_LOCAL_STORAGE_JS)
+
+# LinkedInScraper on Playwright's asyncio API (--browser-backend playwright). One Chromium process
+# and one browser context (so every page shares the login) with up to parallel_pages result pages
+# loading at the same time, instead of one Chrome + ChromeDriver per tab or worker. Parsing,
+# de-duplication, the profile store, the page cache and the output writers are LinkedInScraper's,
+# so both backends produce the same files.
+# Needs: pip install playwright && playwright install chromium
+
+LOGIN_URL = "https://www.linkedin.com/login"
+LOGIN_TIMEOUT = 15 # Seconds to wait for the feed after submitting the login form
+
+class PlaywrightScraper(LinkedInScraper):
+    def start_browser(self, browser_settings):
+        settings = resolve_browser_settings(browser_settings)
+        self.wait_until = "domcontentloaded" if settings["page_load_strategy"] == "eager" else "load"
+        self.loop = asyncio.new_event_loop() # Private event loop: the public methods stay synchronous
+        self.playwright, self.chromium, self.context = self.run(create_playwright_context(settings))
+        self.page_slots = asyncio.Semaphore(self.parallel_pages) # Result pages loading at the same time
+        self.idle_backends = [] # Open tabs not loading anything right now, reused for the next pages
+        self.search_tab = self.run(self.new_backend()) # Login, first page of each search, 'Next' button clicks
+
+    def run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    async def new_backend(self):
+        page = await self.context.new_page()
+        return PlaywrightBackend(page, self.wait_mode, self.max_wait, self.quiet_period,
+                                 self.extraction_mode, self.wait_until, self.selectors.item_selectors)
+
+    # --- Login ---
+    def login(self):
+        # Try the saved session first: one page load instead of the login form (and maybe 2FA)
+        if self.session_file and self.run(self.restore_session()):
+            return
+        try:
+            self.run(self.submit_login())
+            print("Login successful.")
+            self.save_session()
+        except Exception as e:
+            print(f"Login timed out or failed ({e}).")
+            if not self.interactive:
+                print("Cannot complete login/2FA manually in non-interactive mode. Exiting.")
+                self.close()
+                raise SystemExit
+            print("Please check the browser for 2FA or other issues.")
+            input("Press Enter after manually completing login/2FA if needed...")
+            if not self.run(self.is_logged_in(LOGIN_TIMEOUT)):
+                print("Still unable to confirm login. Exiting.")
+                self.close()
+                raise SystemExit
+            print("Login confirmed after manual intervention.")
+            self.save_session()
+
+    async def submit_login(self):
+        page = self.search_tab.page
+        await page.goto(LOGIN_URL, wait_until=self.wait_until)
+        await page.fill("#username", self.username)
+        await page.fill("#password", self.password)
+        await page.press("#password", "Enter")
+        print("Login submitted. Waiting for feed/main page load...")
+        await page.wait_for_selector("#global-nav-search", timeout=LOGIN_TIMEOUT * 1000)
+
+    async def is_logged_in(self, timeout=8):
+        """Waits until the page shows the logged-in navigation (True) or a login/authwall page (False)."""
+        page = self.search_tab.page
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if await page.query_selector("#global-nav-search"):
+                return True
+            if any(marker in page.url for marker in LOGGED_OUT_MARKERS):
+                return False
+            await asyncio.sleep(0.2)
+        return False
+
+    async def restore_session(self):
+        """Same as session_store.restore_session, for the Playwright context."""
+        state = load_session(self.session_file, self.username)
+        if not state:
+            return False
+        print(f"Restoring saved session from '{self.session_file}'...")
+        try:
+            await self.context.add_cookies(session_cookies(state, PLAYWRIGHT_COOKIE_FIELDS))
+            await self.search_tab.page.goto(VERIFY_URL, wait_until=self.wait_until)
+            if not await self.is_logged_in():
+                print("Saved session is no longer valid.")
+                await self.context.clear_cookies() # Start the normal login from a clean state
+                return False
+            if state.get("local_storage"):
+                await self.search_tab.page.evaluate(playwright_script(WRITE_LOCAL_STORAGE_JS), [state["local_storage"]])
+        except Exception as e:
+            print(f"Could not restore the saved session: {e}")
+            return False
+        print("Logged in with the saved session.")
+        return True
+
+    def save_session(self):
+        if not self.session_file:
+            return
+        try:
+            cookies = self.run(self.context.cookies())
+            local_storage = self.run(self.search_tab.page.evaluate(playwright_script(READ_LOCAL_STORAGE_JS), []))
+            write_session(self.session_file, self.username, cookies, local_storage)
+        except Exception as e:
+            print(f"[WARN] Could not save the session to '{self.session_file}': {e}")
+
+    # --- Loading pages ---
+    async def wait_turn_async(self):
+        """Waits until the rate limiter allows the next page load, letting the other pages carry on."""
+        with self.timer.phase("rate_limit"):
+            await self.limiter.wait_async()
+
+    async def settle_page_async(self, backend, label, item_selector=None):
+        """Same as LinkedInScraper.settle_page, for the page open in `backend`."""
+        attempt = 1
+        while True:
+            with self.timer.phase("scroll_wait"):
+                await backend.wait_for_results(item_selector)
+                status = await backend.page_status(item_selector)
+            if not self.retry_page(status, label, attempt):
+                return status
+            attempt += 1
+            await self.wait_turn_async()
+            with self.timer.phase("navigation"):
+                await backend.reload()
+
+    async def open_page(self, backend, url, ready_selector=None):
+        """Opens url in `backend` when the rate limiter allows it. A challenge or throttled page is left for page_status()."""
+        await self.wait_turn_async()
+        try:
+            with self.timer.phase("navigation"):
+                await backend.navigate(url, ready_selector)
+        except Exception:
+            if await backend.page_status() not in BLOCKED_STATUSES: # It has no results container, but is not an error
+                raise
+
+    async def extract_payload(self, backend):
+        """Pulls the rendered results of the page open in `backend` out of the browser."""
+        with self.timer.phase("extraction"):
+            if self.extraction_mode == 'json':
+                return await backend.get_result_rows()
+            return await backend.get_results_html()
+
+    @asynccontextmanager
+    async def idle_tab(self, backend=None):
+        """Takes one of the parallel_pages slots and yields `backend`, or an idle tab (opened if needed)."""
+        async with self.page_slots:
+            if backend is not None:
+                yield backend
+                return
+            backend = self.idle_backends.pop() if self.idle_backends else await self.new_backend()
+            try:
+                yield backend
+            finally:
+                self.idle_backends.append(backend)
+
+    async def load_page(self, search_url, page_number, backend=None):
+        """
+        Opens one results page (in an idle tab unless `backend` is given). Returns (payload, status,
+        phases); the payload is None for a challenge or throttled page (see browser_backends.PAGE_STATUSES)
+        and phases holds this page's load timings, for scrape_payload (other pages load meanwhile).
+        """
+        with self.timer.collect() as phases:
+            async with self.idle_tab(backend) as backend:
+                await self.open_page(backend, build_page_url(search_url, page_number))
+                status = await self.settle_page_async(backend, f"Page {page_number}")
+                payload = await self.extract_payload(backend) if status not in BLOCKED_STATUSES else None
+        return payload, status, phases
+
+    async def load_profile(self, url):
+        """Opens one profile page in an idle tab. Returns (url, HTML of its <main> element or None, error or None)."""
+        async with self.idle_tab() as backend:
+            try:
+                await self.open_page(backend, url, PROFILE_READY_SELECTOR)
+                await backend.wait_for_results(PROFILE_SECTION_SELECTOR)
+                status = await backend.page_status(PROFILE_READY_SELECTOR)
+                self.limiter.report(status)
+                if status != 'ok':
+                    return url, None, f"the page is {PAGE_STATUS_TEXT[status]}"
+                return url, await backend.evaluate(PROFILE_MAIN_JS), None
+            except Exception as e_profile:
+                return url, None, str(e_profile)
+
+    def fetch_profile_pages(self, profile_urls):
+        """Same as LinkedInScraper.fetch_profile_pages, with parallel_pages profiles loading concurrently."""
+        chunk_size = self.parallel_pages * 4 # Results are handed back (and cached) after every chunk
+        for start in range(0, len(profile_urls), chunk_size):
+            chunk = profile_urls[start:start + chunk_size]
+            yield from self.run(self.load_profiles(chunk))
+
+    async def load_profiles(self, urls):
+        return await asyncio.gather(*(self.load_profile(url) for url in urls))
+
+    def scrape_payload(self, payload, page_number, status='ok', phases=None, error=None):
+        """
+        Parses a loaded page and passes its records to the shared record handling. Returns new
+        profiles. phases are the timings collected while the page loaded (see load_page); error is
+        the exception that kept the page from loading, if any.
+        """
+        self.timer.add_phases(phases or {})
+        self.last_page_result_count = 0
+        self.last_page_item_count = 0
+        self.last_page_keys = set()
+        self.last_page_error = None
+        self.last_page_status = status # Pages load concurrently: this is the status of the page being scraped
+        if error is not None:
+            self.page_failed(page_number, error)
+            return 0
+        if status in BLOCKED_STATUSES:
+            self.timer.end_page(page_number, 0) # Not marked done: a resumed search starts here
+            return 0
+        try:
+            page_records = self.records_from_payload(payload, page_number)
+        except Exception as e_scrape:
+            self.page_failed(page_number, e_scrape)
+            return 0
+        return self.add_page_records(page_records, page_number)
+
+    # --- Searches ---
+    def scrape_search(self, start_url, page_limit=float('inf'), filename="linkedin_search_data.csv"):
+        """Same as LinkedInScraper.scrape_search, with the pages after the first loaded concurrently."""
+        return self.run(self.scrape_search_async(start_url, page_limit, filename))
+
+    async def scrape_search_async(self, start_url, page_limit, filename):
+        first_page = self.begin_search(start_url, filename)
+        if first_page > page_limit:
+            print(f"All {page_limit} requested pages of this search were already scraped.")
+            self.finish_stream(completed=True)
+            return {"status": "completed", "pages": first_page - 1, "profiles": self.search_profile_count, "error": None}
+
+        print(f"\nStarting search from: {build_page_url(start_url, first_page)}")
+        try:
+            payload, status, phases = await self.load_page(start_url, first_page, self.search_tab)
+        except Exception as nav_err:
+            return self.navigation_failed(nav_err)
+        print(f"\n--- Scraping Page {first_page} for '{filename}' ---")
+        self.scrape_payload(payload, first_page, status, phases)
+
+        page_count = first_page
+        error = None
+        use_next_button = self.pagination == 'next-button'
+        if status in BLOCKED_STATUSES:
+            error = PageBlockedError(first_page, status)
+        elif not use_next_button and page_count < page_limit and self.is_short_page():
+            print(f"Page {page_count} had {self.last_page_item_count} results. Reached the last available page.")
+        elif not use_next_button and page_count < page_limit:
+            try:
+                page_count, use_next_button = await self.scrape_pages_concurrently(start_url, page_limit, filename, page_count)
+                if use_next_button:
+                    print("Falling back to the 'Next' button.")
+            except Exception as e_pages:
+                print(f"Error while loading pages by URL: {e_pages}")
+                print("Stopping pagination for this search due to error.")
+                error = e_pages
+        if use_next_button and error is None:
+            page_count, error = await self.scrape_pages_by_next_button(page_limit, filename, page_count)
+        return self.end_search(filename, page_count, page_limit, error is None, error)
+
+    async def scrape_pages_concurrently(self, start_url, page_limit, filename, first_page):
+        """
+        Loads the page=N URLs after first_page (already scraped), up to parallel_pages at a time,
+        and scrapes them in page order as they arrive. Stops at the first empty or short page and
+        raises PageBlockedError at a challenge or throttled one; a page that fails to load is
+        recorded as failed and the next ones carry on. Returns (last page scraped, fall_back) like
+        LinkedInScraper.scrape_pages_by_url.
+        """
+        loading = {} # Page number -> task loading it
+        first_page_keys = self.last_page_keys
+        loaded = {} # Page number -> (payload, status, phases, error), waiting for the pages before it to be scraped
+        next_to_load = next_to_scrape = first_page + 1
+        try:
+            while True:
+                # Keep parallel_pages pages ahead of the next page to scrape
+                while next_to_load <= page_limit and next_to_load < next_to_scrape + self.parallel_pages:
+                    loading[next_to_load] = asyncio.ensure_future(self.load_page(start_url, next_to_load))
+                    next_to_load += 1
+                if not loading:
+                    return next_to_scrape - 1, False
+                done, _ = await asyncio.wait(loading.values(), return_when=asyncio.FIRST_COMPLETED)
+                for page in [page for page, task in loading.items() if task in done]:
+                    try:
+                        loaded[page] = loading.pop(page).result() + (None,)
+                    except Exception as e_load: # Scraped as a failed page; the pages after it carry on
+                        loaded[page] = (None, None, {}, e_load)
+                while next_to_scrape in loaded:
+                    page = next_to_scrape
+                    print(f"\n--- Scraping Page {page} for '{filename}' ---")
+                    payload, status, phases, error = loaded.pop(page)
+                    self.scrape_payload(payload, page, status, phases, error)
+                    next_to_scrape += 1
+                    if self.last_page_status in BLOCKED_STATUSES:
+                        raise PageBlockedError(page, self.last_page_status)
+                    if page == first_page + 1 and self.last_page_keys and self.last_page_keys <= first_page_keys:
+                        print(f"Page {page} repeated the results of page {first_page}; the page parameter seems to be ignored.")
+                        return first_page, True # The search tab is still on first_page
+                    if self.is_short_page():
+                        print(f"Page {page} was not a full page of results. Reached the last available page.")
+                        return page, False
+        finally:
+            for task in loading.values(): # Pages past the last one are not needed any more
+                task.cancel()
+            await asyncio.gather(*loading.values(), return_exceptions=True)
+
+    async def scrape_pages_by_next_button(self, page_limit, filename, page_count):
+        """Clicks 'Next' in the search tab page by page. Returns (last page scraped, exception that stopped it or None)."""
+        while page_count < page_limit:
+            try:
+                await self.wait_turn_async()
+                with self.timer.phase("pagination"):
+                    moved = await self.search_tab.next_page()
+                if not moved:
+                    status = await self.search_tab.page_status()
+                    if status in BLOCKED_STATUSES: # A challenge page instead of the next page is not the last page
+                        self.limiter.report(status)
+                        self.last_page_status = status
+                        raise PageBlockedError(page_count + 1, status)
+                    break
+                page_count += 1 # Increment only on successful click and load indication
+            except Exception as e_button:
+                print(f"Error during pagination attempt: {e_button}")
+                print("Stopping pagination for this search due to error.")
+                return page_count, e_button
+            print(f"\n--- Scraping Page {page_count} for '{filename}' ---")
+            try:
+                status = await self.settle_page_async(self.search_tab, f"Page {page_count}")
+                payload = await self.extract_payload(self.search_tab) if status not in BLOCKED_STATUSES else None
+            except Exception as e_scrape:
+                self.page_failed(page_count, e_scrape)
+                continue
+            self.scrape_payload(payload, page_count, status)
+            if status in BLOCKED_STATUSES:
+                return page_count, PageBlockedError(page_count, status)
+        return page_count, None
+
+    def close(self):
+        if not self.loop.is_closed():
+            try:
+                self.run(self.context.close())
+                self.run(self.chromium.close())
+                self.run(self.playwright.stop())
+                print("Browser closed.")
+            except Exception as e:
+                print(f"[WARN] Error while closing the browser: {e}")
+            self.loop.close()
+        super().close()
@@ -0,0 +1,306 @@
+# --- Imports ---
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
+from lxml import etree
+import soupsieve
+import json
+import time
+import sys
+import os
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser # Optional fast parser (pip install selectolax)
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser # Older selectolax releases
+    except ImportError:
+        SelectolaxParser = None
+from selector_strategies import SelectorRegistry, xp_class # Which selectors find the result items (configurable)
+
+# Supported parsing backends:
+#   'html.parser' - BeautifulSoup with Python's built-in parser (original behaviour, slowest)
+#   'lxml'        - BeautifulSoup with the lxml parser (same results, much faster)
+#   'lxml-xpath'  - lxml directly with XPath queries, no BeautifulSoup tree at all (fast path)
+#   'selectolax'  - selectolax CSS engine, if installed (fastest, falls back to 'lxml-xpath')
+PARSER_BACKENDS = ('html.parser', 'lxml', 'lxml-xpath', 'selectolax')
+DEFAULT_BACKEND = 'lxml'
+
+# Class names of the elements that hold the results. The SoupStrainer only keeps these
+# elements (plus everything inside them), so nav, ads, scripts and sidebars are never turned
+# into BeautifulSoup objects. Each selector strategy adds its own strainer_classes (see
+# selector_strategies.py), e.g. 'reusable-search__entity-result-list' and 'linked-area'.
+RESULT_CONTAINER_CLASSES = {'search-results-container'}
+# Finds the result items when parse_profiles is not given another registry (reextract.py, benchmark.py)
+DEFAULT_SELECTORS = SelectorRegistry()
+
+def _class_tokens(value):
+    """Returns the set of class names from a raw attribute value (string or list)."""
+    if not value:
+        return set()
+    if isinstance(value, str):
+        return set(value.split())
+    return set(value)
+
+def results_strainer(selectors=None):
+    """SoupStrainer limited to the containers of every selector strategy, or None if a strategy does not name them."""
+    classes = (selectors or DEFAULT_SELECTORS).strainer_classes
+    if classes is None:
+        return None
+    classes = RESULT_CONTAINER_CLASSES | classes
+    return SoupStrainer(attrs={'class': lambda value: bool(_class_tokens(value) & classes)})
+
+def is_real_profile(name, profile_url):
+    """Checks if essential info (name, URL) was found and looks like a real profile."""
+    return bool(name and profile_url and
+                name != "LinkedIn Member" and
+                '/in/' in profile_url and # Typical profile URLs contain /in/
+                not profile_url.startswith('https://www.linkedin.com/search/')) # Exclude links back to search
+
+def _make_record(name, title, location, profile_url):
+    return {
+        "Name": name,
+        "Title": title,      # Will be None if not found
+        "Location": location,  # Will be None if not found
+        "Profile URL": profile_url,
+    }
+
+# --- Field selectors inside one result item (CSS for BeautifulSoup/selectolax; XPath versions below) ---
+CSS_LINK = 'span.entity-result__title-text a.app-aware-link'
+CSS_NAME_SPAN = 'span[aria-hidden="true"]'
+CSS_TITLE = 'div.entity-result__primary-subtitle'
+CSS_SUMMARY = 'p.entity-result__summary'
+CSS_LOCATION = 'div.entity-result__secondary-subtitle'
+
+# --- BeautifulSoup backends ('html.parser' / 'lxml') ---
+# Compiled once instead of on every select_one call of every item
+SOUP_LINK = soupsieve.compile(CSS_LINK)
+SOUP_NAME_SPAN = soupsieve.compile(CSS_NAME_SPAN)
+SOUP_TITLE = soupsieve.compile(CSS_TITLE)
+SOUP_SUMMARY = soupsieve.compile(CSS_SUMMARY)
+SOUP_LOCATION = soupsieve.compile(CSS_LOCATION)
+
+def _extract_soup(item):
+    name = title = location = profile_url = None
+    # --- Profile URL and Name (Often within the same link) ---
+    link_tag = SOUP_LINK.select_one(item)
+    if link_tag:
+        profile_url = link_tag.get('href', '').split('?')[0] # Get URL and clean params
+        # Name is often within spans inside this link
+        name_span = SOUP_NAME_SPAN.select_one(link_tag)
+        if name_span:
+            name = name_span.text.strip()
+        else: # Fallback if name is directly in the link text
+            name = link_tag.text.strip()
+    # --- Title Selector ---
+    title_tag = SOUP_TITLE.select_one(item)
+    if not title_tag: # Alternative selector sometimes seen
+        title_tag = SOUP_SUMMARY.select_one(item)
+    if title_tag:
+        title = title_tag.text.strip()
+    # --- Location Selector ---
+    location_tag = SOUP_LOCATION.select_one(item)
+    if location_tag:
+        location = location_tag.text.strip()
+    return name, title, location, profile_url
+
+# --- lxml XPath backend ---
+# Compiled once (node.xpath(string) compiles the expression on every call)
+XP_LINK = etree.XPath(f".//span[{xp_class('entity-result__title-text')}]//a[{xp_class('app-aware-link')}]")
+XP_NAME_SPAN = etree.XPath(".//span[@aria-hidden='true']")
+XP_TITLE = etree.XPath(f".//div[{xp_class('entity-result__primary-subtitle')}]")
+XP_SUMMARY = etree.XPath(f".//p[{xp_class('entity-result__summary')}]")
+XP_LOCATION = etree.XPath(f".//div[{xp_class('entity-result__secondary-subtitle')}]")
+
+def _xp_first(node, xpath):
+    """First match of an XPath (string or compiled etree.XPath) under node, or None."""
+    found = node.xpath(xpath) if isinstance(xpath, str) else xpath(node)
+    return found[0] if found else None
+
+def _extract_xpath(item):
+    name = title = location = profile_url = None
+    link_tag = _xp_first(item, XP_LINK)
+    if link_tag is not None:
+        profile_url = link_tag.get('href', '').split('?')[0]
+        name_span = _xp_first(link_tag, XP_NAME_SPAN)
+        name = (name_span if name_span is not None else link_tag).text_content().strip()
+    title_tag = _xp_first(item, XP_TITLE)
+    if title_tag is None:
+        title_tag = _xp_first(item, XP_SUMMARY)
+    if title_tag is not None:
+        title = title_tag.text_content().strip()
+    location_tag = _xp_first(item, XP_LOCATION)
+    if location_tag is not None:
+        location = location_tag.text_content().strip()
+    return name, title, location, profile_url
+
+# --- selectolax backend ---
+def _extract_selectolax(item):
+    name = title = location = profile_url = None
+    link_tag = item.css_first(CSS_LINK)
+    if link_tag is not None:
+        profile_url = (link_tag.attributes.get('href') or '').split('?')[0]
+        name_span = link_tag.css_first(CSS_NAME_SPAN)
+        name = (name_span if name_span is not None else link_tag).text().strip()
+    title_tag = item.css_first(CSS_TITLE)
+    if title_tag is None:
+        title_tag = item.css_first(CSS_SUMMARY)
+    if title_tag is not None:
+        title = title_tag.text().strip()
+    location_tag = item.css_first(CSS_LOCATION)
+    if location_tag is not None:
+        location = location_tag.text().strip()
+    return name, title, location, profile_url
+
+def _load_tree(html, backend, use_strainer, selectors, search_key):
+    """Builds the document tree for a backend and returns (items, extract_function)."""
+    if backend == 'selectolax' and SelectolaxParser is None:
+        print("[WARN] selectolax is not installed, using the 'lxml-xpath' backend instead.")
+        backend = 'lxml-xpath'
+
+    if backend in ('html.parser', 'lxml'):
+        strainer = results_strainer(selectors) if use_strainer else None
+        soup = BeautifulSoup(html, backend, parse_only=strainer)
+        return selectors.find_items(soup, 'soup', search_key), _extract_soup
+    if backend == 'lxml-xpath':
+        if not html or not html.strip():
+            return [], _extract_xpath
+        return selectors.find_items(lxml_html.fromstring(html), 'xpath', search_key), _extract_xpath
+    if backend == 'selectolax':
+        return selectors.find_items(SelectolaxParser(html), 'selectolax', search_key), _extract_selectolax
+    raise ValueError(f"Unknown parser backend '{backend}'. Choose one of: {', '.join(PARSER_BACKENDS)}")
+
+def parse_profiles(html, backend=DEFAULT_BACKEND, use_strainer=True, selectors=None, search_key=None):
+    """
+    Parses the HTML of a LinkedIn search results page (or just its results container)
+    and returns a list of profile records: dicts with Name, Title, Location and Profile URL.
+    Only entries that look like real profiles are returned; duplicates are NOT removed here.
+    No browser is needed, so saved pages can be re-parsed offline.
+    selectors is the SelectorRegistry that finds the result items (DEFAULT_SELECTORS if None);
+    search_key (the search URL) lets it try the strategy that matched on the search's previous page first.
+    """
+    return parse_results_page(html, backend, use_strainer, selectors, search_key)[0]
+
+def parse_results_page(html, backend=DEFAULT_BACKEND, use_strainer=True, selectors=None, search_key=None):
+    """
+    Same as parse_profiles, but returns (records, item_count): item_count is the number of result
+    items on the page, including the ones that are not returned ('LinkedIn Member', no link, ...).
+    A page is full when item_count reaches a page of results, whatever the records look like.
+    """
+    profile_list_items, extract = _load_tree(html, backend, use_strainer, selectors or DEFAULT_SELECTORS, search_key)
+    records = []
+    for i, item in enumerate(profile_list_items):
+        try:
+            name, title, location, profile_url = extract(item)
+            if is_real_profile(name, profile_url):
+                records.append(_make_record(name, title, location, profile_url))
+        except Exception as e_parse:
+            print(f"[WARN] Error parsing one profile container (index {i}): {e_parse}")
+    return records, len(profile_list_items)
+
+def records_from_rows(rows):
+    """
+    Builds profile records from (name, title, location, href) rows that were already
+    extracted in the browser (see the 'json' extraction mode in scraper.py), applying the
+    same cleanup and validation as parse_profiles.
+    """
+    records = []
+    for name, title, location, href in rows:
+        profile_url = (href or '').split('?')[0] or None
+        name = name.strip() if name else name
+        if is_real_profile(name, profile_url):
+            records.append(_make_record(name,
+                                        title.strip() if title else title,
+                                        location.strip() if location else location,
+                                        profile_url))
+    return records
+
+# --- Profile pages (enrich.py) ---
+# Columns added to a search result by visiting the profile itself. Experience is a JSON list of
+# {"title", "company", "dates"} objects, newest first, so it fits in a single CSV cell.
+DETAIL_COLUMNS = ["Headline", "Current Company", "About", "Experience"]
+
+XP_PROFILE_NAME = f"//h1[{xp_class('text-heading-xlarge')}]"
+XP_PROFILE_HEADLINE = f"//div[{xp_class('text-body-medium')} and {xp_class('break-words')}]"
+XP_CURRENT_COMPANY = "//button[starts-with(@aria-label, 'Current company:')]/@aria-label"
+XP_SECTION = "//section[.//div[@id='{anchor}']]" # Profile sections are marked by an empty <div id="about">, ...
+XP_ABOUT_TEXT = f".//div[{xp_class('inline-show-more-text')} or {xp_class('pv-shared-text-with-see-more')}]//span[@aria-hidden='true']"
+XP_EXPERIENCE_ITEMS = f".//li[{xp_class('artdeco-list__item')}]"
+XP_ENTRY_TITLE = f".//div[{xp_class('t-bold')}]//span[@aria-hidden='true']"
+XP_ENTRY_COMPANY = f".//span[{xp_class('t-14')} and {xp_class('t-normal')} and not({xp_class('t-black--light')})]/span[@aria-hidden='true']"
+XP_ENTRY_DATES = f".//span[{xp_class('t-14')} and {xp_class('t-black--light')}]/span[@aria-hidden='true']"
+
+def _xp_text(node, xpath):
+    found = _xp_first(node, xpath)
+    return found.text_content().strip() if found is not None else None
+
+def parse_profile_details(html):
+    """
+    Parses the HTML of a LinkedIn profile page (or just its <main> element) and returns a dict
+    with the DETAIL_COLUMNS plus 'Name'. Fields that are not on the page are None; a page
+    without a name (login wall, removed profile) gives a dict whose values are all None.
+    """
+    details = dict.fromkeys(["Name"] + DETAIL_COLUMNS)
+    if not html or not html.strip():
+        return details
+    tree = lxml_html.fromstring(html)
+    details["Name"] = _xp_text(tree, XP_PROFILE_NAME)
+    if not details["Name"]:
+        return details
+    details["Headline"] = _xp_text(tree, XP_PROFILE_HEADLINE)
+
+    about = _xp_first(tree, XP_SECTION.format(anchor="about"))
+    if about is not None:
+        details["About"] = _xp_text(about, XP_ABOUT_TEXT)
+
+    experience = []
+    section = _xp_first(tree, XP_SECTION.format(anchor="experience"))
+    if section is not None:
+        for item in section.xpath(XP_EXPERIENCE_ITEMS):
+            title = _xp_text(item, XP_ENTRY_TITLE)
+            if not title:
+                continue
+            company = _xp_text(item, XP_ENTRY_COMPANY)
+            if company: # 'Acme Corp · Full-time' -> 'Acme Corp'
+                company = company.split(" · ")[0].strip()
+            experience.append({"title": title, "company": company, "dates": _xp_text(item, XP_ENTRY_DATES)})
+    details["Experience"] = json.dumps(experience, ensure_ascii=False) if experience else None
+
+    # The top card names the current company ('Current company: Acme Corp. Click to skip to experience card')
+    label = _xp_first(tree, XP_CURRENT_COMPANY)
+    if label:
+        details["Current Company"] = label.split(":", 1)[1].split(". Click")[0].strip()
+    elif experience:
+        details["Current Company"] = experience[0]["company"]
+    return details
+
+# --- Offline re-parsing of saved pages ---
+# Usage: python profile_parser.py [--backend lxml-xpath] saved_page1.html saved_page2.html ...
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    backend = DEFAULT_BACKEND
+    if len(args) >= 2 and args[0] == '--backend':
+        backend = args[1]
+        args = args[2:]
+    if not args:
+        print("Usage: python profile_parser.py [--backend BACKEND] page.html [page2.html ...]")
+        print(f"Backends: {', '.join(PARSER_BACKENDS)}")
+        sys.exit(1)
+
+    total_pages = 0
+    total_profiles = 0
+    total_seconds = 0.0
+    for path in args:
+        if not os.path.isfile(path):
+            print(f"Skipping '{path}': not a file.")
+            continue
+        with open(path, encoding='utf-8') as f:
+            page_html = f.read()
+        started = time.perf_counter()
+        page_records = parse_profiles(page_html, backend=backend)
+        total_seconds += time.perf_counter() - started
+        total_pages += 1
+        total_profiles += len(page_records)
+        print(f"{path}: {len(page_records)} profiles")
+    if total_seconds > 0:
+        print(f"Parsed {total_pages} page(s), {total_profiles} profiles in {total_seconds:.3f}s "
+              f"({total_pages / total_seconds:.1f} pages/s) using '{backend}'.")
@@ -0,0 +1,135 @@
+# --- Imports ---
+import json
+import sqlite3
+import time
+from urllib.parse import urlsplit, unquote
+
+def normalize_profile_url(profile_url):
+    """
+    Turns the different spellings of one profile URL into a single key, e.g.
+    'https://uk.linkedin.com/in/Jane-Doe/?miniProfile=...' -> 'https://www.linkedin.com/in/jane-doe'.
+    Used both for in-search dedup and as the unique key of the profile store.
+    """
+    if not profile_url:
+        return profile_url
+    url = profile_url.strip()
+    if url.startswith('/'): # Relative link, e.g. '/in/jane-doe'
+        url = "https://www.linkedin.com" + url
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.endswith('linkedin.com'): # Country subdomains (uk., de., ...) point to the same profile
+        host = 'www.linkedin.com'
+    path = unquote(parts.path).rstrip('/').lower()
+    return f"https://{host}{path}"
+
+class ProfileStore:
+    """
+    On-disk (SQLite) record of every profile ever seen and the searches it appeared in.
+    Lets repeats be skipped or tagged across many searches without loading old CSVs into memory.
+    """
+    def __init__(self, path="linkedin_profiles.db"):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL") # Lets several scraper processes share one store
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                profile_key TEXT NOT NULL,
+                profile_url TEXT,
+                name TEXT,
+                title TEXT,
+                location TEXT,
+                first_seen REAL,
+                last_seen REAL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_key ON profiles (profile_key);
+            CREATE TABLE IF NOT EXISTS profile_searches (
+                profile_key TEXT NOT NULL,
+                search_url TEXT NOT NULL,
+                first_seen REAL,
+                PRIMARY KEY (profile_key, search_url)
+            );
+            CREATE TABLE IF NOT EXISTS profile_details (
+                profile_key TEXT PRIMARY KEY,
+                details TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def record_profiles(self, records, search_url=None):
+        """
+        Stores one page worth of profile records (one transaction) and links them to search_url.
+        Returns the set of profile keys that appeared in an earlier search: one with another
+        search URL, so a search that is run again does not see its own profiles as repeats.
+        Without a search_url, every profile already in the store counts.
+        """
+        if not records:
+            return set()
+        now = time.time()
+        keys = [normalize_profile_url(r["Profile URL"]) for r in records]
+        placeholders = ",".join("?" * len(keys))
+        with self.conn: # Commits on success, rolls back on error
+            if search_url:
+                already_seen = {row[0] for row in self.conn.execute(
+                    f"SELECT DISTINCT profile_key FROM profile_searches WHERE search_url != ? AND profile_key IN ({placeholders})",
+                    [search_url] + keys)}
+            else:
+                already_seen = {row[0] for row in self.conn.execute(
+                    f"SELECT profile_key FROM profiles WHERE profile_key IN ({placeholders})", keys)}
+            self.conn.executemany(
+                """INSERT INTO profiles (profile_key, profile_url, name, title, location, first_seen, last_seen)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (profile_key) DO UPDATE SET
+                       name = excluded.name, title = excluded.title,
+                       location = excluded.location, last_seen = excluded.last_seen""",
+                [(key, r["Profile URL"], r.get("Name"), r.get("Title"), r.get("Location"), now, now)
+                 for key, r in zip(keys, records)])
+            if search_url:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO profile_searches (profile_key, search_url, first_seen) VALUES (?, ?, ?)",
+                    [(key, search_url, now) for key in keys])
+        return already_seen
+
+    def has_seen(self, profile_url):
+        key = normalize_profile_url(profile_url)
+        return self.conn.execute("SELECT 1 FROM profiles WHERE profile_key = ?", (key,)).fetchone() is not None
+
+    def searches_for(self, profile_url):
+        """Returns the search URLs a profile has appeared in (oldest first)."""
+        key = normalize_profile_url(profile_url)
+        rows = self.conn.execute(
+            "SELECT search_url FROM profile_searches WHERE profile_key = ? ORDER BY first_seen", (key,))
+        return [row[0] for row in rows]
+
+    def get_details(self, profile_urls, max_age=None):
+        """
+        Returns {profile key: details dict} for the profiles enriched (see enrich.py) less than
+        max_age seconds ago (any age if max_age is None). Missing or expired profiles are left out.
+        """
+        keys = list({normalize_profile_url(url) for url in profile_urls if url})
+        oldest = time.time() - max_age if max_age is not None else 0
+        found = {}
+        for start in range(0, len(keys), 500): # Stay below SQLite's limit on query parameters
+            chunk = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT profile_key, details FROM profile_details WHERE fetched_at >= ? "
+                f"AND profile_key IN ({','.join('?' * len(chunk))})", [oldest] + chunk)
+            found.update((key, json.loads(details)) for key, details in rows)
+        return found
+
+    def save_details(self, profile_url, details):
+        """Stores (or replaces) the enriched fields of one profile; committed at once, so nothing is fetched twice."""
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO profile_details (profile_key, details, fetched_at) VALUES (?, ?, ?)
+                   ON CONFLICT (profile_key) DO UPDATE SET details = excluded.details, fetched_at = excluded.fetched_at""",
+                (normalize_profile_url(profile_url), json.dumps(details, ensure_ascii=False), time.time()))
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,107 @@
+# --- Imports ---
+import asyncio
+import multiprocessing
+import random
+import time
+
+# Paces page loads for a whole run. One RateLimiter is created by the main process and handed to
+# every batch worker (its state lives in shared memory), so N browsers together stay under one
+# limit instead of N limits.
+#
+# Token bucket: `rate` page loads per minute, with up to `burst` loads allowed back to back.
+# AIMD adaptation after every page (see report()):
+#   clean page ('ok' / 'no_results')  -> rate + INCREASE_PER_PAGE (additive increase, up to max_rate)
+#   'empty' (no results, no message)  -> rate * EMPTY_FACTOR
+#   'challenge' / 'throttled'         -> rate * BLOCK_FACTOR and a pause of `cooldown` seconds for
+#                                        everyone; the pause doubles while blocks keep coming
+INCREASE_PER_PAGE = 0.5 # Pages/minute added after each clean page
+EMPTY_FACTOR = 0.8
+BLOCK_FACTOR = 0.5
+COOLDOWN_SECONDS = 60 # First pause after a challenge/throttled page ...
+MAX_COOLDOWN_SECONDS = 900 # ... doubling up to this
+JITTER = 0.2 # Waits vary by +/- 20% so requests do not arrive on a fixed beat
+
+class RateLimiter:
+    def __init__(self, rate=15, min_rate=2, max_rate=40, burst=2, cooldown=COOLDOWN_SECONDS):
+        if min_rate <= 0:
+            raise ValueError(f"min_rate must be greater than 0 pages/minute, got {min_rate}")
+        self.min_rate = min_rate
+        self.base_cooldown = cooldown
+        self.max_rate = max(max_rate, min_rate)
+        self.burst = max(1, burst)
+        self.lock = multiprocessing.Lock()
+        now = time.time()
+        # Shared state (multiprocessing.RawValue guarded by self.lock, so it survives being passed to worker processes)
+        self.rate = multiprocessing.RawValue('d', min(max(rate, min_rate), self.max_rate)) # Current limit, pages/minute
+        self.tokens = multiprocessing.RawValue('d', 1.0)
+        self.updated_at = multiprocessing.RawValue('d', now)
+        self.paused_until = multiprocessing.RawValue('d', 0.0)
+        self.cooldown = multiprocessing.RawValue('d', cooldown)
+        self.started_at = multiprocessing.RawValue('d', now)
+        self.pages = multiprocessing.RawValue('l', 0) # Pages reported, any status
+        self.blocks = multiprocessing.RawValue('l', 0) # Challenge/throttled pages seen
+        self.slowdowns = multiprocessing.RawValue('l', 0)
+
+    def reserve(self):
+        """
+        Takes the next page-load slot. Returns how many seconds to wait before loading the page.
+        During a pause the slots are counted from the end of the pause, so the callers waiting on
+        it leave one by one at the current rate instead of all at once when it ends.
+        """
+        with self.lock:
+            now = time.time()
+            start = max(now, self.paused_until.value)
+            rate_per_second = self.rate.value / 60
+            refill = max(0.0, start - self.updated_at.value) * rate_per_second
+            self.tokens.value = min(self.burst, self.tokens.value + refill)
+            self.updated_at.value = max(self.updated_at.value, start)
+            self.tokens.value -= 1
+            pacing = max(0.0, -self.tokens.value / rate_per_second)
+        # Jitter only spreads the pacing; the pause itself is always waited out in full
+        return (start - now) + pacing * random.uniform(1 - JITTER, 1 + JITTER)
+
+    def wait(self):
+        """Blocks until this process may load the next page."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self):
+        """Same as wait(), without blocking the other pages of an asyncio event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def report(self, status):
+        """Adapts the rate to how a page came back (a browser_backends.PAGE_STATUSES value)."""
+        with self.lock:
+            self.pages.value += 1
+            if status in ('ok', 'no_results'):
+                self.rate.value = min(self.max_rate, self.rate.value + INCREASE_PER_PAGE)
+                self.cooldown.value = self.base_cooldown # The block is over, the next pause starts short again
+                return
+            factor = BLOCK_FACTOR if status in ('challenge', 'throttled') else EMPTY_FACTOR
+            self.rate.value = max(self.min_rate, self.rate.value * factor)
+            self.slowdowns.value += 1
+            if status in ('challenge', 'throttled'):
+                self.blocks.value += 1
+                now = time.time()
+                if self.paused_until.value < now: # One pause per burst of blocked pages, not one per tab
+                    self.paused_until.value = now + self.cooldown.value
+                    self.cooldown.value = min(MAX_COOLDOWN_SECONDS, self.cooldown.value * 2)
+                self.tokens.value = min(self.tokens.value, 0.0) # No burst right after the pause ...
+                self.updated_at.value = max(self.updated_at.value, self.paused_until.value) # ... nor refill during it
+                print(f"[RATE] LinkedIn returned a {status} page. Pausing all browsers until "
+                      f"{time.strftime('%H:%M:%S', time.localtime(self.paused_until.value))} "
+                      f"and slowing down to {self.rate.value:.1f} pages/min.")
+
+    def pages_per_minute(self):
+        """Effective pages per minute since the limiter was created (all workers together)."""
+        minutes = (time.time() - self.started_at.value) / 60
+        return self.pages.value / minutes if minutes > 0 else 0.0
+
+    def summary(self):
+        return (f"{self.pages.value} pages at {self.pages_per_minute():.1f} pages/min effective "
+                f"(limit now {self.rate.value:.1f}/min, {self.slowdowns.value} slowdowns, {self.blocks.value} blocked pages)")
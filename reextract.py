@@ -0,0 +1,77 @@
+# --- Imports ---
+import argparse
+import os
+import time
+import pandas as pd
+from page_cache import PageCache
+from profile_parser import parse_profiles, DEFAULT_BACKEND, DEFAULT_SELECTORS, PARSER_BACKENDS
+from selector_strategies import SelectorRegistry
+from profile_store import normalize_profile_url
+
+# Rebuilds search outputs from the page cache (see page_cache.py) without opening a browser.
+# Usage: python reextract.py [--cache page_cache] [--search URL] [--output-dir reextracted] [--selectors selectors.json]
+
+def reextract_search(cache, search_url, backend=DEFAULT_BACKEND, selectors=DEFAULT_SELECTORS):
+    """Parses the newest cached capture of every page of a search. Returns (records, pages parsed)."""
+    records = []
+    seen_keys = set()
+    pages = cache.latest_pages(search_url)
+    for page, cache_key in pages:
+        html = cache.read(cache_key)
+        if html is None:
+            print(f"  Page {page}: cached file is missing, skipping.")
+            continue
+        for record in parse_profiles(html, backend=backend, selectors=selectors, search_key=search_url):
+            key = normalize_profile_url(record["Profile URL"])
+            if key not in seen_keys:
+                seen_keys.add(key)
+                records.append(record)
+    return records, len(pages)
+
+def describe_missing_fields(records):
+    """Short summary of how many records lack each field (shows whether a selector fix worked)."""
+    if not records:
+        return "no profiles"
+    missing = [f"{field}: {sum(1 for r in records if not r.get(field))}" for field in ("Name", "Title", "Location")]
+    return "empty " + ", ".join(missing)
+
+# --- Main Execution Logic ---
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Regenerate search results from cached pages, without a browser.")
+    arg_parser.add_argument("--cache", default="page_cache", help="Page cache directory (default: %(default)s)")
+    arg_parser.add_argument("--search", metavar="URL", help="Only re-extract this search URL")
+    arg_parser.add_argument("--output-dir", default="reextracted", help="Where to write the CSV files (default: %(default)s)")
+    arg_parser.add_argument("--parser-backend", choices=PARSER_BACKENDS, default=DEFAULT_BACKEND,
+                            help="HTML parsing backend (default: %(default)s)")
+    arg_parser.add_argument("--selectors", metavar="JSON_PATH",
+                            help="Selector strategies file to use instead of the built-in ones (see selector_strategies.py)")
+    args = arg_parser.parse_args()
+    selectors = SelectorRegistry.load(args.selectors) if args.selectors else DEFAULT_SELECTORS
+
+    if not os.path.isdir(args.cache):
+        print(f"Page cache '{args.cache}' not found. Run the scraper with --page-cache first.")
+        raise SystemExit(1)
+    cache = PageCache(args.cache, max_bytes=float('inf')) # Never evict while reading
+    searches = [s for s in cache.searches() if not args.search or s[0] == args.search]
+    if not searches:
+        print("No cached pages found for the given search." if args.search else "The page cache is empty.")
+        raise SystemExit(1)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    total_pages = 0
+    for number, (search_url, output_file, _) in enumerate(searches, start=1):
+        print(f"\nRe-extracting {search_url}")
+        search_records, page_count = reextract_search(cache, search_url, args.parser_backend, selectors)
+        total_pages += page_count
+        filename = os.path.basename(output_file) if output_file else f"search_{number}.csv"
+        path = os.path.join(args.output_dir, filename)
+        if search_records:
+            pd.DataFrame(search_records).to_csv(path, index=False, encoding='utf-8')
+            print(f"  {page_count} pages -> {len(search_records)} unique profiles ({describe_missing_fields(search_records)}) saved to '{path}'")
+        else:
+            print(f"  {page_count} pages -> no profiles found. The selectors (profile_parser.py, --selectors) may still need updating.")
+    elapsed = time.perf_counter() - started
+    print(f"\nRe-extracted {len(searches)} searches ({total_pages} pages) in {elapsed:.1f}s.")
+    print(f"Selector strategies (pages with results / pages tried): {selectors.summary()}")
+    cache.close()
@@ -1,26 +1,125 @@
 # --- Imports ---
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, NoSuchWindowException
 import pandas as pd
 import time
 import re # Import regex for cleaning
 import getpass # Import for hidden password input
 import os # Import os for path operations (like checking filename)
+import json
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote
+import argparse # Optional command-line settings (credentials/URLs are still asked interactively)
+from profile_parser import parse_results_page, records_from_rows, DEFAULT_BACKEND, PARSER_BACKENDS # HTML -> profile records, no browser needed
+from profile_store import ProfileStore, normalize_profile_url # Optional on-disk record of every profile seen
+from output_writers import open_writer, output_path, SearchCheckpoint, OUTPUT_FORMATS # Streaming output + resume
+from browser_config import create_chrome_driver, DEFAULT_BROWSER_SETTINGS, FAST_BROWSER_SETTINGS # Chrome start-up settings
+from session_store import save_session, restore_session # Reuse a saved login instead of logging in again
+from page_cache import PageCache # Optional cache of raw result pages for offline re-extraction
+from timing import PhaseTimer # Per-phase timing (navigation, scroll_wait, parse, ...)
+from browser_backends import (SeleniumBackend, BROWSER_BACKENDS, EXTRACTION_MODES, # Navigate/wait/extract/paginate per browser library
+                              PROFILE_READY_SELECTOR, PROFILE_SECTION_SELECTOR, PROFILE_MAIN_JS,
+                              RETRY_STATUSES, BLOCKED_STATUSES, PAGE_STATUS_TEXT)
+from rate_limiter import RateLimiter # Paces page loads for the whole run and slows down when LinkedIn pushes back
+from selector_strategies import SelectorRegistry # Which selectors find the result items, learned per search
+
+# --- Pagination ---
+RESULTS_PER_PAGE = 10 # A full LinkedIn search results page; fewer result items means it was the last page
+PAGINATION_MODES = ('page-url', 'next-button')
+# Opens a URL in a new tab named arguments[1] without waiting for it, so the browser loads several
+# tabs at the same time. The name finds the tab again (driver.switch_to.window(name)) whatever
+# order the browser lists its window handles in.
+OPEN_TAB_JS = "window.open(arguments[0], arguments[1]);"
+PAGE_RETRIES = 2 # Times a challenge/throttled/empty page is loaded again (after the rate limiter's slowdown)
+
+class PageBlockedError(Exception):
+    """LinkedIn kept answering with a challenge or throttled page. The search stops (resumable), it did not end."""
+    def __init__(self, page_number, status):
+        super().__init__(f"page {page_number} is {PAGE_STATUS_TEXT[status]}")
+        self.page_number = page_number
+        self.status = status
+
+class PageFailedError(Exception):
+    """A page could not be scraped (e.g. a browser or parse error). The others are still scraped, but the search is not complete."""
+    def __init__(self, page_number, error):
+        super().__init__(f"page {page_number} could not be scraped: {error}")
+        self.page_number = page_number
+
+def build_page_url(search_url, page):
+    """Returns the URL of results page `page` of a search (LinkedIn accepts a page=N query parameter)."""
+    parts = urlsplit(search_url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'page']
+    if page > 1:
+        query.append(('page', str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query, quote_via=quote)))
 
 class LinkedInScraper:
-    def __init__(self, username, password):
+    def __init__(self, username, password, parser_backend=DEFAULT_BACKEND, store=None, skip_seen=False,
+                 wait_mode='adaptive', max_wait=15, quiet_period=0.5, extraction_mode='container',
+                 pagination='page-url', parallel_pages=3, stream=False, output_format='csv', browser_settings=None,
+                 session_file=None, page_cache=None, metrics_jsonl=None, metrics_prometheus=None, rate_limiter=None,
+                 selector_file=None, interactive=True):
         self.username = username
         self.password = password
-        self.driver = webdriver.Chrome() # Ensure ChromeDriver is accessible
+        self.interactive = interactive # False for batch workers: never wait for Enter in the terminal
+        self.session_file = session_file # JSON file with saved cookies/localStorage (None = always log in)
+        self.driver = None # Selenium WebDriver (None with other browser backends)
         self.current_search_data = [] # Data for the current search only
+        self.current_search_keys = set() # Normalized profile URLs already in current_search_data (O(1) dedup)
+        self.current_search_url = None
+        self.parser_backend = parser_backend # See profile_parser.PARSER_BACKENDS
+        # Result item selector strategies, from selector_file (JSON) or the built-in ones
+        self.selectors = SelectorRegistry.load(selector_file) if selector_file else SelectorRegistry()
+        self.store = store # Optional ProfileStore shared across searches
+        self.page_cache = page_cache # Optional PageCache keeping the HTML of every scraped page
+        self.current_output_file = None
+        self.skip_seen = skip_seen # With a store: drop profiles seen in earlier searches instead of tagging them
+        self.wait_mode = wait_mode # 'adaptive' (return as soon as results render) or 'fixed' (original sleeps)
+        self.max_wait = max_wait # Ceiling in seconds for the adaptive waits
+        self.quiet_period = quiet_period # Seconds without DOM changes before a page counts as fully rendered
+        self.extraction_mode = extraction_mode # See EXTRACTION_MODES
+        self.last_page_bytes = 0 # Bytes pulled from the browser for the last page
+        self.search_bytes = 0 # ... and for the whole current search
+        self.pagination = pagination # 'page-url' (open page=N URLs in parallel tabs) or 'next-button'
+        self.parallel_pages = max(1, parallel_pages) # Pages loaded at the same time with 'page-url' pagination
+        self.last_page_result_count = 0 # Profiles found on the last scraped page (before dedup)
+        self.last_page_item_count = 0 # Result items on that page, hidden members included (decides the last page)
+        self.last_page_keys = set() # Their normalized profile URLs (to spot a page that repeats the previous one)
+        self.last_page_error = None # Exception that kept the last page from being scraped (never taken for a short page)
+        self.stream = stream # Write each page's rows to disk as soon as it is parsed, with a checkpoint
+        self.output_format = output_format # See output_writers.OUTPUT_FORMATS (streaming only)
+        self.writer = None # Open streaming writer for the current search
+        self.checkpoint = None # SearchCheckpoint for the current search
+        self.completed_pages = set() # Pages of the current search that are done
+        self.last_completed_page = 0 # Highest page such that it and all pages before it are done
+        self.search_profile_count = 0 # Unique profiles collected for the current search
+        self.timer = PhaseTimer(metrics_jsonl, metrics_prometheus) # Where the time goes, per page and per search
+        self.limiter = rate_limiter or RateLimiter() # Shared by all batch workers when passed in
+        self.last_page_status = None # See browser_backends.PAGE_STATUSES
+        self.start_browser(browser_settings)
+
+    def start_browser(self, browser_settings):
+        """Starts Chrome through Selenium. Other browser backends override this (see playwright_scraper.py)."""
+        self.driver = create_chrome_driver(browser_settings) # Ensure ChromeDriver is accessible (see browser_config.py)
+        self.backend = SeleniumBackend(self.driver, self.wait_mode, self.max_wait, self.quiet_period, self.extraction_mode,
+                                       self.selectors.item_selectors)
         self.wait = WebDriverWait(self.driver, 15) # Standard wait timeout
 
+    def save_session(self):
+        """Saves the logged-in session so later runs (and other workers) can skip the login form."""
+        if not self.session_file:
+            return
+        try:
+            save_session(self.driver, self.session_file, self.username)
+        except Exception as e:
+            print(f"[WARN] Could not save the session to '{self.session_file}': {e}")
+
     def login(self):
+        # Try the saved session first: one page load instead of the login form (and maybe 2FA)
+        if self.session_file and restore_session(self.driver, self.session_file, self.username):
+            return
         # Using WebDriverWait for more reliable login
         try:
             self.driver.get("https://www.linkedin.com/login")
@@ -32,13 +131,19 @@ class LinkedInScraper:
             print("Login submitted. Waiting for feed/main page load...")
             self.wait.until(EC.presence_of_element_located((By.ID, "global-nav-search")))
             print("Login successful.")
+            self.save_session()
         except TimeoutException:
              print("Login timed out or failed. Element indicating successful login not found.")
+             if not self.interactive:
+                 print("Cannot complete login/2FA manually in non-interactive mode. Exiting.")
+                 self.close()
+                 raise SystemExit
              print("Please check the browser for 2FA or other issues.")
              input("Press Enter after manually completing login/2FA if needed...")
              try:
                  self.wait.until(EC.presence_of_element_located((By.ID, "global-nav-search")))
                  print("Login confirmed after manual intervention.")
+                 self.save_session()
              except TimeoutException:
                  print("Still unable to confirm login. Exiting.")
                  self.close()
@@ -48,134 +153,475 @@ class LinkedInScraper:
             self.close()
             raise
 
-    def clear_current_search_data(self):
-        """Resets the data list for a new search."""
+    def clear_current_search_data(self, search_url=None):
+        """Resets the data list (and its dedup index) for a new search."""
         self.current_search_data = []
+        self.current_search_keys = set()
+        self.current_search_url = search_url
+        self.search_bytes = 0
+        self.search_profile_count = 0
+        self.completed_pages = set()
+        self.last_completed_page = 0
+        self.last_page_status = None
+        self.failed_pages = {} # Page number -> exception, for pages that could not be scraped
         print("Cleared data for the new search.")
 
-    # scrape_current_page now uses selectors from the user's working script
-    def scrape_current_page(self):
-        """Scrapes profiles from the currently loaded page and adds unique ones (for this search) to self.current_search_data."""
+    def start_stream(self, search_url, filename):
+        """
+        Opens the streaming writer for a search. If an unfinished checkpoint for the same search
+        exists, restores the collected profile URLs and returns the page to continue from.
+        """
+        path = output_path(filename, self.output_format)
+        self.checkpoint = SearchCheckpoint(path)
+        state = self.checkpoint.load(search_url)
+        if state:
+            self.current_search_keys = set(state["seen_urls"])
+            self.search_profile_count = state["profiles_written"]
+            self.last_completed_page = state["last_completed_page"]
+            self.completed_pages = set(range(1, self.last_completed_page + 1))
+            print(f"Resuming '{path}' from page {self.last_completed_page + 1} "
+                  f"({self.search_profile_count} profiles already saved).")
+        self.writer = open_writer(path, self.output_format, append=bool(state))
+        print(f"Streaming results to '{path}' as each page is scraped.")
+        return self.last_completed_page + 1
+
+    def record_page_done(self, page_number):
+        """Marks a page as done and updates the checkpoint once its rows are safely on disk."""
+        if page_number is None or self.writer is None:
+            return
+        self.completed_pages.add(page_number)
+        while self.last_completed_page + 1 in self.completed_pages:
+            self.last_completed_page += 1
+        if self.writer.pending_rows == 0: # Buffered (Parquet) rows are not on disk yet
+            self.checkpoint.save(self.current_search_url, self.last_completed_page,
+                                 self.current_search_keys, self.search_profile_count)
+
+    def finish_stream(self, completed):
+        """Flushes and closes the streaming writer; completed searches are not resumed next time."""
+        if self.writer is None:
+            return
+        self.writer.close()
+        self.checkpoint.save(self.current_search_url, self.last_completed_page,
+                             self.current_search_keys, self.search_profile_count, completed=completed)
+        print(f"Data for the current search saved to '{self.writer.path}' ({self.search_profile_count} unique profiles)")
+        self.writer = None
+
+    def save_results(self, filename, completed=False):
+        """Saves the current search: closes the stream if streaming, otherwise writes the CSV."""
+        if self.writer is not None:
+            self.finish_stream(completed)
+        else:
+            self.save_to_csv(filename)
+
+    def extract_page_records(self, page_number=None):
+        """Pulls the current page's results out of the browser and returns profile records."""
+        with self.timer.phase("extraction"):
+            if self.extraction_mode == 'json':
+                payload = self.backend.get_result_rows()
+            else:
+                payload = self.backend.get_results_html()
+        return self.records_from_payload(payload, page_number)
+
+    def records_from_payload(self, payload, page_number=None):
+        """
+        Turns what the browser returned for a page (HTML, or JSON rows in 'json' mode) into profile
+        records. Sets last_page_item_count to the number of result items the page had.
+        """
+        if self.extraction_mode == 'json':
+            with self.timer.phase("parse"):
+                rows = json.loads(payload)
+                page_records = records_from_rows(rows)
+            self.last_page_item_count = len(rows)
+        else:
+            if self.page_cache is not None and page_number is not None:
+                self.page_cache.put(self.current_search_url, page_number, payload, self.current_output_file)
+            print(f"Parsing page source (backend: '{self.parser_backend}')...")
+            with self.timer.phase("parse"):
+                page_records, self.last_page_item_count = parse_results_page(
+                    payload, backend=self.parser_backend, selectors=self.selectors, search_key=self.current_search_url)
+        self.last_page_bytes = len(payload.encode('utf-8'))
+        self.search_bytes += self.last_page_bytes
+        print(f"Transferred {self.last_page_bytes / 1024:.1f} KB from the browser ('{self.extraction_mode}' mode).")
+        return page_records
+
+    # scrape_current_page scrolls the page, then hands the HTML to profile_parser.parse_results_page
+    def scrape_current_page(self, page_number=None):
+        """
+        Scrapes profiles from the currently loaded page and adds unique ones (for this search) to
+        self.current_search_data, or writes them straight to disk when streaming.
+        """
+        self.last_page_result_count = 0
+        self.last_page_item_count = 0
+        self.last_page_keys = set()
+        self.last_page_error = None
+        try:
+            # --- Scroll until all results are rendered (reloading challenge/throttled/empty pages) ---
+            if self.settle_page(f"Page {page_number}") in BLOCKED_STATUSES:
+                self.timer.end_page(page_number, 0) # Not marked done: a resumed search starts here
+                return 0
+            page_records = self.extract_page_records(page_number)
+        except Exception as e_scrape:
+            self.page_failed(page_number, e_scrape)
+            return 0
+        return self.add_page_records(page_records, page_number)
+
+    def page_failed(self, page_number, error):
+        """
+        Records a page that could not be scraped. It is not marked done, so a resumed search
+        starts there, and it does not count as a short (last) page.
+        """
+        print(f"Error scraping current page state: {error}")
+        self.last_page_error = error
+        self.failed_pages.setdefault(page_number, error)
+        self.timer.end_page(page_number, 0)
+
+    def is_short_page(self):
+        """True if the last scraped page had fewer than a full page of result items (and was scraped at all)."""
+        return self.last_page_error is None and self.last_page_item_count < RESULTS_PER_PAGE
+
+    def wait_turn(self):
+        """Waits until the rate limiter allows the next page load."""
+        with self.timer.phase("rate_limit"):
+            self.limiter.wait()
+
+    def retry_page(self, status, label, attempt):
+        """
+        Reports how a page came back to the rate limiter (which slows down on anything but a clean
+        page). Returns True if the page should be loaded again.
+        """
+        self.limiter.report(status)
+        self.last_page_status = status
+        if status not in RETRY_STATUSES:
+            return False
+        if attempt > PAGE_RETRIES:
+            print(f"{label} is still {PAGE_STATUS_TEXT[status]} after {PAGE_RETRIES} retries.")
+            return False
+        print(f"{label} came back as {PAGE_STATUS_TEXT[status]}. Loading it again ({attempt}/{PAGE_RETRIES})...")
+        return True
+
+    def settle_page(self, label, item_selector=None):
+        """
+        Waits for the page in the current tab to render and checks what came back. Challenge,
+        throttled and empty pages are reloaded (as paced by the rate limiter) up to PAGE_RETRIES
+        times. Returns the final status (see browser_backends.PAGE_STATUSES). item_selector
+        defaults to the result items of the selector strategies.
+        """
+        attempt = 1
+        while True:
+            with self.timer.phase("scroll_wait"):
+                self.backend.wait_for_results(item_selector)
+                status = self.backend.page_status(item_selector)
+            if not self.retry_page(status, label, attempt):
+                return status
+            attempt += 1
+            self.wait_turn()
+            with self.timer.phase("navigation"):
+                self.backend.reload()
+
+    def blocked_now(self):
+        """True if the current tab shows a challenge or throttled page (e.g. after a failed navigation)."""
+        try:
+            return self.backend.page_status() in BLOCKED_STATUSES
+        except Exception:
+            return False
+
+    def add_page_records(self, page_records, page_number=None):
+        """
+        De-duplicates one page's records (within the search, and against the store) and keeps the
+        new ones: in self.current_search_data, or written to disk when streaming. Shared by every
+        browser backend. Returns the number of new profiles.
+        """
+        self.last_page_result_count = len(page_records)
+        self.last_page_keys = set()
         try:
-            # --- Robust Scrolling Logic ---
-            print("Scrolling down page...")
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            scroll_attempts = 0
-            max_scroll_attempts = 5 # Increased attempts for potentially slow loading pages
-            stable_count = 0 # Counter for consecutive stable scrolls
-            while scroll_attempts < max_scroll_attempts:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2.5) # Wait for content to potentially load after scroll
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    stable_count += 1
-                    if stable_count >= 2: # Consider it stable if height doesn't change for 2 checks
-                         print("Scroll height stabilized.")
-                         break
+            if not page_records:
+                print("Could not find any profiles on this page.")
+                self.record_page_done(page_number)
+                self.timer.end_page(page_number, 0)
+                return 0
+
+            print(f"Found {len(page_records)} profiles on this page. Checking each for duplicates...")
+            records_started = time.perf_counter()
+            new_records = []
+            for record in page_records:
+                # --- Check for Duplicates *within this search* (set lookup, not a scan) ---
+                key = normalize_profile_url(record['Profile URL'])
+                self.last_page_keys.add(key)
+                if key not in self.current_search_keys:
+                    self.current_search_keys.add(key)
+                    new_records.append(record)
+                # else: # Optional: uncomment to see which profiles are duplicates *on this page/search*
+                #     print(f"  - Duplicate profile skipped: {record['Name']} ({record['Profile URL']})")
+
+            # --- Check against profiles seen in *earlier* searches ---
+            if self.store is not None and new_records:
+                seen_before = self.store.record_profiles(new_records, self.current_search_url)
+                if self.skip_seen:
+                    skipped = len(new_records)
+                    new_records = [r for r in new_records if normalize_profile_url(r['Profile URL']) not in seen_before]
+                    skipped -= len(new_records)
+                    if skipped:
+                        print(f"Skipped {skipped} profiles already seen in earlier searches.")
                 else:
-                    last_height = new_height
-                    stable_count = 0 # Reset counter if height changes
-                scroll_attempts += 1
-                if scroll_attempts == max_scroll_attempts:
-                    print("Max scroll attempts reached.")
-            time.sleep(1) # Final short pause
-
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            print("Parsing page source...")
-
-            # --- Use Profile Container Selector ---
-            # Adjusted based on common LinkedIn structures, but might need tweaking
-            # Trying a more general approach that might contain the desired info
-            # Often, list items `<li>` within a `<ul>` hold search results
-            profile_list_items = soup.select('ul.reusable-search__entity-result-list > li.reusable-search__result-container')
-
-            if not profile_list_items:
-                # Fallback or alternative structure check (like the original 'div.linked-area')
-                profile_list_items = soup.find_all('div', class_='linked-area') # Your original selector as fallback
-                if not profile_list_items:
-                    print("No profile containers found using common selectors ('li.reusable-search__result-container' or 'div.linked-area'). Structure might have changed.")
-                    # Try finding *any* search result item structure if the specific ones fail
-                    potential_results = soup.find_all(lambda tag: tag.name == 'li' and 'result' in tag.get('class', []))
-                    if potential_results:
-                        print(f"Found {len(potential_results)} potential result items using a generic 'li' search. Attempting to parse...")
-                        profile_list_items = potential_results
-                    else:
-                         print("Could not find any likely profile result containers.")
-                         return 0
-
-            count_on_page = 0
-            print(f"Found {len(profile_list_items)} potential profile containers/list items. Checking each...")
-
-            for i, item in enumerate(profile_list_items):
-                name = None
-                title = None
-                location = None
-                profile_url = None
-
-                try:
-                    # --- Profile URL and Name (Often within the same link) ---
-                    # Look for the main link containing the name
-                    # This selector targets the primary link often associated with the person's name/profile
-                    link_tag = item.select_one('span.entity-result__title-text a.app-aware-link')
-                    if link_tag:
-                        profile_url = link_tag.get('href', '').split('?')[0] # Get URL and clean params
-                        # Name is often within spans inside this link
-                        name_span = link_tag.select_one('span[aria-hidden="true"]')
-                        if name_span:
-                            name = name_span.text.strip()
-                        else: # Fallback if name is directly in the link text
-                            name = link_tag.text.strip()
-
-                    # --- Title Selector ---
-                    # Titles are often in a subsequent sibling div or paragraph
-                    title_tag = item.select_one('div.entity-result__primary-subtitle')
-                    if title_tag:
-                        title = title_tag.text.strip()
-                    else: # Alternative selector sometimes seen
-                        title_tag = item.select_one('p.entity-result__summary') # Check this too
-                        if title_tag:
-                             title = title_tag.text.strip()
-
-
-                    # --- Location Selector ---
-                    location_tag = item.select_one('div.entity-result__secondary-subtitle')
-                    if location_tag:
-                        location = location_tag.text.strip()
-
-                    # --- Basic Validation ---
-                    # Check if essential info (name, URL) was found and looks like a real profile
-                    is_real_profile = (name and profile_url and
-                                       name != "LinkedIn Member" and
-                                       '/in/' in profile_url and # Typical profile URLs contain /in/
-                                       not profile_url.startswith('https://www.linkedin.com/search/')) # Exclude links back to search
-
-                    if is_real_profile:
-                        # --- Check for Duplicates *within this search* ---
-                        if not any(d['Profile URL'] == profile_url for d in self.current_search_data):
-                            self.current_search_data.append({
-                                "Name": name,
-                                "Title": title,      # Will be None if not found
-                                "Location": location,  # Will be None if not found
-                                "Profile URL": profile_url,
-                            })
-                            count_on_page += 1
-                        # else: # Optional: uncomment to see which profiles are duplicates *on this page/search*
-                        #     print(f"  - Duplicate profile skipped: {name} ({profile_url})")
-
-                except Exception as e_parse:
-                    print(f"[WARN] Error parsing one profile container (index {i}): {e_parse}")
-                    # Optional: print problematic item's HTML for debugging
-                    # print(f"Problematic HTML snippet:\n{item.prettify()}\n--------------------")
-
+                    for record in new_records:
+                        record["Seen Before"] = normalize_profile_url(record['Profile URL']) in seen_before
+
+            self.search_profile_count += len(new_records)
+            if self.writer is None:
+                self.current_search_data.extend(new_records)
+            self.timer.add("records", time.perf_counter() - records_started)
+            if self.writer is not None: # Streaming: rows go to disk now, not into memory
+                with self.timer.phase("save"): # Written and synced to disk, like the final save
+                    self.writer.write_rows(new_records)
+                    self.record_page_done(page_number)
+            count_on_page = len(new_records)
 
             print(f"Finished parsing page. Added {count_on_page} new, unique profiles to this search's data list.")
+            self.timer.end_page(page_number, count_on_page)
             return count_on_page
 
-        except Exception as e_scrape:
-            print(f"Error scraping current page state: {e_scrape}")
+        except Exception as e_records:
+            print(f"Error processing the profiles of this page: {e_records}")
+            self.timer.end_page(page_number, 0)
             return 0
 
+    def scrape_pages_by_url(self, start_url, page_limit, filename, first_page=1):
+        """
+        Scrapes the pages after first_page (already scraped) up to page_limit by opening their
+        page=N URLs directly, up to parallel_pages tabs at a time so the browser loads them
+        concurrently (each tab opens when the rate limiter allows it). Stops at the first empty or
+        short page; raises PageBlockedError if LinkedIn keeps answering with a challenge or
+        throttled page. Returns (last page scraped, fall_back) where fall_back is True if LinkedIn
+        ignored the page parameter and the caller should use the 'Next' button instead.
+        """
+        main_window = self.driver.current_window_handle
+        first_page_keys = self.last_page_keys
+        last_scraped = first_page
+        next_page = first_page + 1
+        while next_page <= page_limit:
+            batch = [n for n in range(next_page, next_page + self.parallel_pages) if n <= page_limit]
+            print(f"\nLoading pages {batch[0]}-{batch[-1]} in {len(batch)} tab(s)...")
+            old_windows = set(self.driver.window_handles)
+            for n in batch:
+                self.wait_turn()
+                with self.timer.phase("pagination"):
+                    self.driver.execute_script(OPEN_TAB_JS, build_page_url(start_url, n), f"page-{n}")
+            new_windows = [h for h in self.driver.window_handles if h not in old_windows]
+
+            short_pages = [] # Pages with fewer than a full page of results
+            try:
+                for page in batch:
+                    print(f"\n--- Scraping Page {page} for '{filename}' ---")
+                    try:
+                        with self.timer.phase("navigation"):
+                            self.driver.switch_to.window(f"page-{page}")
+                            self.backend.wait_for_tab() # A new tab starts on about:blank
+                    except Exception as e_tab:
+                        self.page_failed(page, e_tab)
+                        continue
+                    self.scrape_current_page(page)
+                    if self.last_page_status in BLOCKED_STATUSES:
+                        raise PageBlockedError(page, self.last_page_status)
+                    if page == first_page + 1 and self.last_page_keys and self.last_page_keys <= first_page_keys:
+                        print(f"Page {page} repeated the results of page {first_page}; the page parameter seems to be ignored.")
+                        return first_page, True # The search's own tab is still on first_page
+                    if self.is_short_page():
+                        short_pages.append(page)
+            finally:
+                # Close this batch's tabs and go back to the search's own tab
+                with self.timer.phase("pagination"):
+                    for window in new_windows:
+                        if window in self.driver.window_handles:
+                            self.driver.switch_to.window(window)
+                            self.driver.close()
+                    self.driver.switch_to.window(main_window)
+            if short_pages:
+                last_scraped = min(short_pages)
+                print(f"Page {last_scraped} was not a full page of results. Reached the last available page.")
+                break
+            last_scraped = batch[-1]
+            next_page = batch[-1] + 1
+        return last_scraped, False
+
+    def fetch_profile_pages(self, profile_urls):
+        """
+        Loads profile pages (for enrich.py), parallel_pages tabs at a time as paced by the rate
+        limiter, and yields (url, HTML of the profile's <main> element or None, error message or
+        None) in order.
+        """
+        main_window = self.driver.current_window_handle
+        for start in range(0, len(profile_urls), self.parallel_pages):
+            batch = profile_urls[start:start + self.parallel_pages]
+            old_windows = set(self.driver.window_handles)
+            tabs = [] # (url, its window name, error opening it or None), in batch order
+            try:
+                for i, url in enumerate(batch, start):
+                    self.wait_turn()
+                    try:
+                        self.driver.execute_script(OPEN_TAB_JS, url, f"enrich-{i}")
+                    except Exception as e_open:
+                        tabs.append((url, None, str(e_open)))
+                        continue
+                    tabs.append((url, f"enrich-{i}", None))
+                for url, window, open_error in tabs:
+                    if open_error is not None:
+                        yield url, None, open_error
+                        continue
+                    try:
+                        self.driver.switch_to.window(window)
+                    except NoSuchWindowException:
+                        yield url, None, "the browser did not open a tab for this profile"
+                        continue
+                    try:
+                        self.backend.wait_for_tab()
+                        self.backend.wait_for_results(PROFILE_SECTION_SELECTOR)
+                        status = self.backend.page_status(PROFILE_READY_SELECTOR)
+                        self.limiter.report(status)
+                        if status != 'ok':
+                            yield url, None, f"the page is {PAGE_STATUS_TEXT[status]}"
+                            continue
+                        html = self.driver.execute_script(PROFILE_MAIN_JS)
+                    except Exception as e_profile:
+                        yield url, None, str(e_profile)
+                        continue
+                    yield url, html, None
+            finally:
+                for window in self.driver.window_handles:
+                    if window not in old_windows:
+                        self.driver.switch_to.window(window)
+                        self.driver.close()
+                self.driver.switch_to.window(main_window)
+
+    def scrape_search(self, start_url, page_limit=float('inf'), filename="linkedin_search_data.csv"):
+        """
+        Scrapes one search from its first page up to page_limit pages (or the last page),
+        then saves it to filename. Returns a summary dict with status, pages and profiles.
+        """
+        first_page = self.begin_search(start_url, filename)
+        if first_page > page_limit:
+            print(f"All {page_limit} requested pages of this search were already scraped.")
+            self.finish_stream(completed=True)
+            return {"status": "completed", "pages": first_page - 1, "profiles": self.search_profile_count, "error": None}
+
+        first_url = build_page_url(start_url, first_page) if first_page > 1 else start_url
+        print(f"\nStarting search from: {first_url}")
+        try:
+            self.wait_turn()
+            with self.timer.phase("navigation"):
+                self.backend.navigate(first_url) # Waits for the results container to appear
+            print("Initial search results page loaded.")
+        except (TimeoutException, Exception) as nav_err:
+            if not self.blocked_now(): # A challenge page has no results container; it is retried below
+                return self.navigation_failed(nav_err)
+
+        # --- First page ---
+        page_count = first_page
+        search_successful = True # Flag to track if scraping process completed without major errors
+        error = None
+        print(f"\n--- Scraping Page {page_count} for '{filename}' ---")
+        self.scrape_current_page(page_count)
+
+        # --- Pages 2+ by URL, several at a time ---
+        use_next_button = self.pagination == 'next-button'
+        if self.last_page_status in BLOCKED_STATUSES:
+            search_successful = False
+            error = PageBlockedError(page_count, self.last_page_status)
+            use_next_button = False
+        elif not use_next_button and page_count < page_limit and self.is_short_page():
+            print(f"Page {page_count} had {self.last_page_item_count} results. Reached the last available page.")
+        elif not use_next_button and page_count < page_limit:
+            try:
+                page_count, use_next_button = self.scrape_pages_by_url(start_url, page_limit, filename, page_count)
+                if use_next_button:
+                    print("Falling back to the 'Next' button.")
+            except Exception as e_pages:
+                print(f"Error while loading pages by URL: {e_pages}")
+                print("Stopping pagination for this search due to error.")
+                search_successful = False
+                error = e_pages
+
+        # --- Pagination Loop with the 'Next' button ---
+        while use_next_button and page_count < page_limit:
+            try:
+                self.wait_turn()
+                with self.timer.phase("pagination"):
+                    moved = self.backend.next_page()
+                if not moved:
+                    status = self.backend.page_status()
+                    if status in BLOCKED_STATUSES: # A challenge page instead of the next page is not the last page
+                        self.limiter.report(status)
+                        self.last_page_status = status
+                        raise PageBlockedError(page_count + 1, status)
+                    break
+                page_count += 1 # Increment only on successful click and load indication
+            except Exception as e_button:
+                print(f"Error during pagination attempt: {e_button}")
+                print("Stopping pagination for this search due to error.")
+                search_successful = False # Mark that this search had issues
+                error = e_button
+                break
+            print(f"\n--- Scraping Page {page_count} for '{filename}' ---")
+            self.scrape_current_page(page_count)
+            if self.last_page_status in BLOCKED_STATUSES:
+                search_successful = False
+                error = PageBlockedError(page_count, self.last_page_status)
+                break
+
+        # --- End of Pagination Loop for THIS search ---
+        return self.end_search(filename, page_count, page_limit, search_successful, error)
+
+    def begin_search(self, start_url, filename):
+        """Resets the per-search state (and opens the stream/checkpoint). Returns the first page to scrape."""
+        self.clear_current_search_data(start_url) # Reset data list for the new search
+        self.current_output_file = filename
+        self.timer.start_search(start_url)
+        return self.start_stream(start_url, filename) if self.stream else 1
+
+    def navigation_failed(self, nav_err):
+        """Closes a search whose first page could not be opened. Returns its summary dict."""
+        print(f"Error navigating to the start URL or loading initial results: {nav_err}")
+        self.finish_stream(completed=False)
+        self.timer.end_search(self.search_profile_count)
+        return {"status": "navigation_failed", "pages": 0, "profiles": self.search_profile_count, "error": str(nav_err)}
+
+    def end_search(self, filename, page_count, page_limit, search_successful, error=None):
+        """
+        Saves a finished (or stopped) search and returns its summary dict. `error` is the exception
+        that stopped it; a search that skipped a page it could not scrape is not complete either.
+        """
+        failed = sorted(page for page in self.failed_pages if page is not None and page <= page_count)
+        if error is None and failed:
+            search_successful = False
+            error = PageFailedError(failed[0], self.failed_pages[failed[0]])
+            print(f"\nPage(s) {', '.join(map(str, failed))} could not be scraped; the search is not complete "
+                  f"(with --stream, running it again resumes from page {failed[0]}).")
+        if search_successful:
+            if page_count >= page_limit:
+                print(f"\nCompleted scraping up to the specified limit of {page_limit} pages for '{filename}'.")
+            else: # Reached end naturally or via 'all' pages
+                print(f"\nFinished scraping all available pages for '{filename}'.")
+        else:
+            print(f"\nScraping for '{filename}' stopped due to an error during pagination.")
+
+        # --- Save Data for THIS Search ---
+        with self.timer.phase("save"):
+            self.save_results(filename, completed=search_successful)
+        self.timer.end_search(self.search_profile_count)
+        print(f"Total unique profiles collected *for this specific search* ({filename}): {self.search_profile_count}")
+        print(f"Data transferred from the browser for this search: {self.search_bytes / 1024:.1f} KB")
+        print(f"Time per phase for this search: {self.timer.summary()}")
+        print(f"Rate limiter: {self.limiter.summary()}")
+        if self.extraction_mode != 'json': # Rows extracted in the browser do not go through the selector strategies
+            print(f"Selector strategies (pages with results / pages tried, whole run): {self.selectors.summary()}")
+        if isinstance(error, PageBlockedError):
+            print("LinkedIn is blocking or throttling this account. Run the search again later "
+                  "(with --stream it resumes from the blocked page).")
+            status = "blocked"
+        else:
+            status = "completed" if search_successful else "pagination_error"
+        return {"status": status, "pages": page_count,
+                "profiles": self.search_profile_count, "error": str(error) if error is not None else None}
+
     def save_to_csv(self, filename="linkedin_search_data.csv"):
         """Saves the data collected for the *current search* to a specified CSV file."""
         if not self.current_search_data:
@@ -198,7 +644,12 @@ class LinkedInScraper:
     def close(self):
         if self.driver:
             self.driver.quit()
+            self.driver = None
             print("Browser closed.")
+        if self.store is not None:
+            self.store.close()
+        if self.page_cache is not None:
+            self.page_cache.close()
 
 # --- Function to sanitize filename ---
 def sanitize_filename(name):
@@ -214,9 +665,135 @@ def sanitize_filename(name):
         name = "unnamed_search"
     return name
 
+def create_scraper(username, password, browser_backend='selenium', **options):
+    """Creates the scraper for a browser backend (see browser_backends.BROWSER_BACKENDS)."""
+    if browser_backend == 'playwright':
+        from playwright_scraper import PlaywrightScraper # Optional (pip install playwright), imported only when used
+        return PlaywrightScraper(username, password, **options)
+    return LinkedInScraper(username, password, **options)
+
+# --- Command-line settings shared by scraper.py and batch.py ---
+def positive_float(value):
+    """argparse type for settings that must be above zero (a rate of 0 would never load a page)."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+def add_scraper_arguments(parser):
+    """Adds the optional scraper settings to an argparse parser."""
+    parser.add_argument("--parser-backend", choices=PARSER_BACKENDS, default=DEFAULT_BACKEND,
+                        help="HTML parsing backend (default: %(default)s)")
+    parser.add_argument("--store", metavar="DB_PATH",
+                        help="SQLite file recording every profile ever seen, shared across searches")
+    parser.add_argument("--skip-seen", action="store_true",
+                        help="With --store: leave out profiles seen in earlier searches (default: tag them with 'Seen Before')")
+    parser.add_argument("--wait-mode", choices=("adaptive", "fixed"), default="adaptive",
+                        help="'adaptive' continues as soon as results have rendered, 'fixed' uses the original sleeps (default: %(default)s)")
+    parser.add_argument("--max-wait", type=float, default=15,
+                        help="Longest time in seconds to wait for a page to render in adaptive mode (default: %(default)s)")
+    parser.add_argument("--quiet-period", type=float, default=0.5,
+                        help="Seconds without page changes before a page counts as rendered (default: %(default)s)")
+    parser.add_argument("--extraction-mode", choices=EXTRACTION_MODES, default="container",
+                        help="What to pull from the browser per page: the whole page, only the results container, "
+                             "or fields already extracted as JSON (default: %(default)s)")
+    parser.add_argument("--pagination", choices=PAGINATION_MODES, default="page-url",
+                        help="'page-url' opens page=N URLs directly, 'next-button' clicks through pages (default: %(default)s)")
+    parser.add_argument("--parallel-pages", type=int, default=3,
+                        help="With page-url pagination: how many pages to load at the same time (default: %(default)s)")
+    parser.add_argument("--browser-backend", choices=BROWSER_BACKENDS, default="selenium",
+                        help="'selenium' drives Chrome through ChromeDriver, 'playwright' drives Chromium through "
+                             "Playwright with --parallel-pages pages loading concurrently (default: %(default)s)")
+    parser.add_argument("--rate", type=positive_float, default=15,
+                        help="Page loads per minute to start with, for all browsers/workers together; adapts between "
+                             "--min-rate and --max-rate as LinkedIn responds (default: %(default)s)")
+    parser.add_argument("--min-rate", type=positive_float, default=2,
+                        help="Slowest page loads per minute after challenges or throttling (default: %(default)s)")
+    parser.add_argument("--max-rate", type=positive_float, default=40,
+                        help="Fastest page loads per minute while pages come back clean (default: %(default)s)")
+    parser.add_argument("--selectors", metavar="JSON_PATH",
+                        help="Load the selector strategies that find result items from this file instead of the "
+                             "built-in ones (python selector_strategies.py prints them as a starting point)")
+    parser.add_argument("--session-file", metavar="JSON_PATH",
+                        help="Save the login session here and reuse it on later runs instead of logging in again "
+                             "(the file gives access to your account, keep it private)")
+    parser.add_argument("--page-cache", metavar="DIR",
+                        help="Keep the compressed HTML of every scraped page here, so reextract.py can rebuild "
+                             "the results after a selector fix without scraping again")
+    parser.add_argument("--page-cache-size-mb", type=float, default=500,
+                        help="Size limit of the page cache; least recently used pages are deleted first (default: %(default)s)")
+    parser.add_argument("--metrics-jsonl", metavar="FILE",
+                        help="Append per-page and per-search phase timings as JSON lines to this file")
+    parser.add_argument("--metrics-prometheus", metavar="FILE",
+                        help="Write run totals as Prometheus counters to this file after every search")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write rows to disk after every page and keep a checkpoint, so an interrupted search "
+                             "resumes from the next page when run again with the same URL and filename")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="csv",
+                        help="File format when streaming (default: %(default)s)")
+    # Browser settings: --fast-browser turns them all on, the individual flags override it either way
+    parser.add_argument("--fast-browser", action="store_true",
+                        help="Headless Chrome with eager page loads, blocked images/fonts/media/trackers, no extensions and no GPU")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=None,
+                        help="Run Chrome without a window (complete any 2FA in a normal run first)")
+    parser.add_argument("--page-load-strategy", choices=("normal", "eager"), default=None,
+                        help="'eager' stops waiting for images and other sub-resources once the page's HTML is ready")
+    parser.add_argument("--block-resources", action=argparse.BooleanOptionalAction, default=None,
+                        help="Block images, media, fonts and analytics requests")
+    parser.add_argument("--disable-extensions", action=argparse.BooleanOptionalAction, default=None,
+                        help="Start Chrome without extensions")
+    parser.add_argument("--disable-gpu", action=argparse.BooleanOptionalAction, default=None,
+                        help="Start Chrome without its GPU process")
+
+def browser_settings_from_args(args):
+    """Builds the browser settings dict from --fast-browser and the individual browser flags."""
+    settings = dict(FAST_BROWSER_SETTINGS if args.fast_browser else DEFAULT_BROWSER_SETTINGS)
+    for key in DEFAULT_BROWSER_SETTINGS:
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+    return settings
+
+def open_page_cache(args):
+    """Opens the page cache requested on the command line (None if not requested)."""
+    if not args.page_cache:
+        return None
+    if args.extraction_mode == 'json':
+        print("[WARN] --extraction-mode json returns no HTML, so nothing will be added to the page cache.")
+    return PageCache(args.page_cache, max_bytes=args.page_cache_size_mb * 1024 * 1024)
+
+def rate_limiter_from_args(args):
+    """Creates the run's RateLimiter from --rate/--min-rate/--max-rate (pass the same one to every worker)."""
+    return RateLimiter(rate=args.rate, min_rate=args.min_rate, max_rate=args.max_rate)
+
+def scraper_options(args):
+    """Turns parsed command-line settings into create_scraper keyword arguments (store, page cache and rate limiter excluded)."""
+    return {
+        "browser_backend": args.browser_backend,
+        "parser_backend": args.parser_backend,
+        "skip_seen": args.skip_seen,
+        "wait_mode": args.wait_mode,
+        "max_wait": args.max_wait,
+        "quiet_period": args.quiet_period,
+        "extraction_mode": args.extraction_mode,
+        "pagination": args.pagination,
+        "parallel_pages": args.parallel_pages,
+        "stream": args.stream,
+        "output_format": args.output_format,
+        "browser_settings": browser_settings_from_args(args),
+        "session_file": args.session_file,
+        "selector_file": args.selectors,
+        "metrics_jsonl": args.metrics_jsonl,
+        "metrics_prometheus": args.metrics_prometheus,
+    }
+
 # --- Main Execution Logic ---
 if __name__ == "__main__":
 
+    # --- Optional Settings ---
+    arg_parser = argparse.ArgumentParser(description="Scrape LinkedIn people search results to CSV.")
+    add_scraper_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
     # --- Get Credentials Securely ---
     print("-" * 30)
     print("Please enter your LinkedIn credentials:")
@@ -232,7 +809,10 @@ if __name__ == "__main__":
     current_search_filename = None # To hold the filename for the current search
 
     try:
-        scraper = LinkedInScraper(linkedin_username, linkedin_password)
+        profile_store = ProfileStore(args.store) if args.store else None
+        scraper = create_scraper(linkedin_username, linkedin_password, store=profile_store,
+                                 page_cache=open_page_cache(args), rate_limiter=rate_limiter_from_args(args),
+                                 **scraper_options(args))
         scraper.login() # Attempt login
 
         # --- Main Interaction Loop ---
@@ -279,93 +859,11 @@ if __name__ == "__main__":
                 else:
                     print("Filename cannot be empty.")
 
-            # --- Prepare for New Search ---
-            scraper.clear_current_search_data() # Reset data list for the new search
-
-            print(f"\nStarting search from: {start_url}")
-            try:
-                scraper.driver.get(start_url)
-                # Wait for a key element of the results page to appear
-                scraper.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.reusable-search__entity-result-list, div.search-results-container"))) # Check for common containers
-                print("Initial search results page loaded.")
-            except (TimeoutException, Exception) as nav_err:
-                print(f"Error navigating to the start URL or loading initial results: {nav_err}")
+            # --- Scrape and Save THIS Search ---
+            search_summary = scraper.scrape_search(start_url, user_page_limit, current_search_filename)
+            if search_summary["status"] == "navigation_failed":
                 print("Please check the URL and your connection. Asking for URL again.")
-                current_search_filename = None # Reset filename as this search failed
-                continue
-
-            # --- Pagination Loop for THIS search ---
-            page_count = 1
-            search_successful = True # Flag to track if scraping process completed without major errors
-            while page_count <= user_page_limit:
-                print(f"\n--- Scraping Page {page_count} for '{current_search_filename}' ---")
-                # Optional: Add slight delay before scraping each page
-                # time.sleep(random.uniform(1.5, 3.0))
-                profiles_found_on_page = scraper.scrape_current_page()
-
-                # Check if user limit reached *after* scraping the target page
-                if page_count >= user_page_limit:
-                    print(f"Reached user-defined page limit of {user_page_limit} for this search.")
-                    break
-
-                # --- Attempt to Paginate ---
-                try:
-                    next_button_selector = 'button[aria-label="Next"]'
-                    # Use presence check first, then check if clickable, more robust
-                    scraper.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, next_button_selector)))
-                    next_button = scraper.driver.find_element(By.CSS_SELECTOR, next_button_selector)
-
-                    # Check if the button is disabled (often indicates the last page)
-                    if next_button.get_attribute("disabled"):
-                         print("Next button is disabled. Reached the last available page.")
-                         break
-
-                    # Scroll the button into view slightly before clicking (can help)
-                    scraper.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                    time.sleep(0.5) # Short pause after scroll
-
-                    # Wait until the button is truly clickable
-                    next_button_clickable = scraper.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, next_button_selector)))
-                    print("Found 'Next' button, clicking...")
-                    scraper.driver.execute_script("arguments[0].click();", next_button_clickable) # Use JS click for reliability
-
-                    # --- Wait for Next Page Load Indicator ---
-                    print("Waiting for next page to load...")
-                    # It's hard to find a perfect universal indicator. Waiting for the old button
-                    # to potentially go stale or for a results container element is common.
-                    # Let's try waiting for a slight change or re-appearance of results container
-                    time.sleep(2) # Give it a moment to start loading
-                    scraper.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.reusable-search__entity-result-list, div.search-results-container")))
-                    # Optional: Check if URL changed, though might not always happen reliably
-                    # scraper.wait.until(lambda d: start_url not in d.current_url or f"page={page_count+1}" in d.current_url)
-
-                    print("Next page appears to be loaded.")
-                    page_count += 1 # Increment only on successful click and load indication
-
-                except TimeoutException:
-                    print("No 'Next' button found, clickable, or page didn't load within timeout. Assuming last page reached.")
-                    break
-                except NoSuchElementException:
-                    print("No 'Next' button element found. Reached the last available page.")
-                    break
-                except Exception as e_button:
-                    print(f"Error during pagination attempt: {e_button}")
-                    print("Stopping pagination for this search due to error.")
-                    search_successful = False # Mark that this search had issues
-                    break
-
-            # --- End of Pagination Loop for THIS search ---
-            if search_successful:
-                if page_count > user_page_limit and user_page_limit != float('inf'):
-                    print(f"\nCompleted scraping up to the specified limit of {user_page_limit} pages for '{current_search_filename}'.")
-                else: # Reached end naturally or via 'all' pages
-                    print(f"\nFinished scraping all available pages for '{current_search_filename}'.")
-            else:
-                print(f"\nScraping for '{current_search_filename}' stopped due to an error during pagination.")
 
-            # --- Save Data for THIS Search ---
-            scraper.save_to_csv(current_search_filename)
-            print(f"Total unique profiles collected *for this specific search* ({current_search_filename}): {len(scraper.current_search_data)}")
             current_search_filename = None # Reset for the next loop iteration
 
         # --- End of Main Interaction Loop ---
@@ -375,17 +873,17 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\n[INFO] KeyboardInterrupt detected.")
         # Attempt to save data from the search that was *in progress*
-        if scraper and current_search_filename and scraper.current_search_data:
+        if scraper and current_search_filename and scraper.search_profile_count:
              print(f"Attempting to save data collected so far for '{current_search_filename}'...")
-             scraper.save_to_csv(current_search_filename)
+             scraper.save_results(current_search_filename)
         else:
              print("No data from the current search to save.")
     except Exception as e:
         print(f"\nA critical error occurred in the main execution block: {e}")
         # Attempt to save data from the search that was *in progress*
-        if scraper and current_search_filename and scraper.current_search_data:
+        if scraper and current_search_filename and scraper.search_profile_count:
             print(f"Attempting to save any data collected for '{current_search_filename}' before the error...")
-            scraper.save_to_csv(current_search_filename)
+            scraper.save_results(current_search_filename)
         else:
             print("No data to save or scraper/filename not available.")
     finally:
@@ -0,0 +1,159 @@
+# --- Imports ---
+import json
+import sys
+import soupsieve
+from lxml import etree
+
+# Selector strategies: the different ways of finding the result items on a search page, tried in
+# the configured order (generic ones last) until one finds something. LinkedIn serves more than one
+# layout, and changes them, so the registry remembers which specific strategy matched on the
+# previous page of a search and tries it first. The others are only scanned when it finds nothing, and every attempt is counted, so a
+# strategy that stops matching (markup drift) shows up in the hit rates.
+#
+# The strategies can be replaced without touching the code: write them to a JSON file
+# (python selector_strategies.py > selectors.json prints the built-in ones) and pass it with
+# --selectors selectors.json. Each strategy has:
+#   name             - shown in the hit rates
+#   css              - selector for the result items (BeautifulSoup and selectolax backends, and the
+#                      browser: the adaptive wait, page status, container and 'json' extraction)
+#   xpath            - the same for the 'lxml-xpath' backend (optional; without it the strategy is skipped there)
+#   strainer_classes - class names of the elements that contain the items; the BeautifulSoup
+#                      backends only build these (optional; without it nothing is filtered out)
+#   generic          - true for a loose last-resort match, which prints a warning when used
+
+def xp_class(cls):
+    """XPath predicate matching a single class token (same semantics as CSS '.cls')."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+DEFAULT_STRATEGIES = [
+    {
+        "name": "entity-result-list",
+        # Often, list items `<li>` within a `<ul>` hold search results
+        "css": "ul.reusable-search__entity-result-list > li.reusable-search__result-container",
+        "xpath": f"//ul[{xp_class('reusable-search__entity-result-list')}]/li[{xp_class('reusable-search__result-container')}]",
+        "strainer_classes": ["reusable-search__entity-result-list"],
+    },
+    {
+        "name": "linked-area", # Alternative structure (the original 'div.linked-area')
+        "css": "div.linked-area",
+        "xpath": f"//div[{xp_class('linked-area')}]",
+        "strainer_classes": ["linked-area"],
+    },
+    {
+        "name": "generic-li", # *Any* <li> with a 'result' class, if the specific ones fail
+        "css": "li.result",
+        "xpath": f"//li[{xp_class('result')}]",
+        "strainer_classes": ["result"],
+        "generic": True,
+    },
+]
+
+class SelectorStrategy:
+    def __init__(self, name, css, xpath=None, strainer_classes=None, generic=False):
+        self.name = name
+        self.css = css
+        self.xpath = xpath
+        self.strainer_classes = set(strainer_classes) if strainer_classes is not None else None
+        self.generic = generic
+        # Compiled once here instead of on every page
+        self.soup_selector = soupsieve.compile(css)
+        self.xpath_query = etree.XPath(xpath) if xpath else None
+        self.tries = 0 # Pages this strategy was tried on ...
+        self.hits = 0 # ... and found result items on
+        self.warned_no_xpath = False
+
+    @classmethod
+    def from_dict(cls, spec):
+        return cls(spec["name"], spec["css"], spec.get("xpath"), spec.get("strainer_classes"), spec.get("generic", False))
+
+    def find(self, tree, kind):
+        """Returns the result items in a parsed page. kind is 'soup', 'xpath' or 'selectolax' (see profile_parser)."""
+        if kind == 'soup':
+            return self.soup_selector.select(tree)
+        if kind == 'xpath':
+            if self.xpath_query is None:
+                if not self.warned_no_xpath:
+                    print(f"[WARN] Selector strategy '{self.name}' has no 'xpath', so the 'lxml-xpath' backend skips it.")
+                    self.warned_no_xpath = True
+                return []
+            return self.xpath_query(tree)
+        return tree.css(self.css)
+
+class SelectorRegistry:
+    def __init__(self, strategies=None):
+        self.strategies = [SelectorStrategy.from_dict(spec) for spec in (strategies or DEFAULT_STRATEGIES)]
+        self.preferred = {} # Search URL -> strategy that matched on its last page
+
+    @classmethod
+    def load(cls, path):
+        """Reads strategies from a JSON file: a list of strategies, or {"strategies": [...]}."""
+        with open(path, encoding="utf-8") as f:
+            spec = json.load(f)
+        strategies = spec["strategies"] if isinstance(spec, dict) else spec
+        if not strategies:
+            raise ValueError(f"No selector strategies in '{path}'.")
+        registry = cls(strategies)
+        print(f"Loaded {len(registry.strategies)} selector strategies from '{path}'.")
+        return registry
+
+    @property
+    def search_order(self):
+        """The strategies in the configured order, generic ones moved to the end."""
+        return ([strategy for strategy in self.strategies if not strategy.generic] +
+                [strategy for strategy in self.strategies if strategy.generic])
+
+    @property
+    def item_selectors(self):
+        """The strategies' CSS selectors in search_order, for finding the result items in the browser."""
+        return [strategy.css for strategy in self.search_order]
+
+    @property
+    def strainer_classes(self):
+        """Class names every strategy needs kept by the SoupStrainer, or None if a strategy does not say."""
+        if any(strategy.strainer_classes is None for strategy in self.strategies):
+            return None
+        return set().union(*(strategy.strainer_classes for strategy in self.strategies))
+
+    def find_items(self, tree, kind, search_key=None):
+        """
+        Returns the result items of a parsed page using the first strategy that finds any: the
+        one that matched on this search's previous page first, then the others in the configured
+        order. Generic strategies always come last and are never remembered for the next page.
+        Without a search_key (pages that are not part of a search) nothing is remembered.
+        """
+        preferred = self.preferred.get(search_key) if search_key is not None else None
+        order = self.search_order
+        if preferred is not None:
+            order.remove(preferred)
+            order.insert(0, preferred)
+        for position, strategy in enumerate(order):
+            if position == 1 and preferred is not None:
+                print(f"Selector strategy '{preferred.name}' found no results on this page, trying the others...")
+            items = strategy.find(tree, kind)
+            strategy.tries += 1
+            if not items:
+                continue
+            strategy.hits += 1
+            if strategy.generic:
+                print(f"Found {len(items)} potential result items using the generic '{strategy.name}' strategy. Attempting to parse...")
+                self.preferred.pop(search_key, None) # The next page starts from the specific strategies again
+            elif search_key is not None:
+                self.preferred[search_key] = strategy
+            if preferred is not None and strategy is not preferred:
+                print(f"Selector strategy '{strategy.name}' matched instead of '{preferred.name}' (the markup may have changed).")
+            return items
+        print(f"No profile containers found using any selector strategy "
+              f"({', '.join(repr(strategy.name) for strategy in self.strategies)}). Structure might have changed.")
+        return []
+
+    def hit_rates(self):
+        """Strategy name -> (pages with results, pages tried)."""
+        return {strategy.name: (strategy.hits, strategy.tries) for strategy in self.strategies}
+
+    def summary(self):
+        return ", ".join(f"{name} {hits}/{tries}" for name, (hits, tries) in self.hit_rates().items() if tries) or "not used"
+
+# Prints the built-in strategies as JSON, as a starting point for --selectors
+if __name__ == "__main__":
+    json.dump({"strategies": DEFAULT_STRATEGIES}, sys.stdout, indent=2)
+    print()
@@ -0,0 +1,119 @@
+# --- Imports ---
+import json
+import os
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# Saves the logged-in LinkedIn session (cookies for every domain + localStorage) to a JSON file
+# and restores it on later runs, so a browser can skip the login form and 2FA.
+# NOTE: the file gives full access to the LinkedIn account. Keep it private.
+
+AUTH_COOKIE = "li_at" # LinkedIn's login cookie; no valid li_at means no session
+VERIFY_URL = "https://www.linkedin.com/feed/"
+# Pages LinkedIn redirects to when the session is not (or no longer) valid
+LOGGED_OUT_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/", "/signup")
+# Fields accepted by the DevTools Network.setCookies command
+COOKIE_PARAM_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+# ... and by Playwright's BrowserContext.add_cookies (which stores cookies in the same format)
+PLAYWRIGHT_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+# Reads / restores localStorage without overwriting keys the page has already set
+READ_LOCAL_STORAGE_JS = ("var items = {}; for (var i = 0; i < localStorage.length; i++) {"
+                         " var key = localStorage.key(i); items[key] = localStorage.getItem(key); } return items;")
+WRITE_LOCAL_STORAGE_JS = ("var items = arguments[0]; Object.keys(items).forEach(function (key) {"
+                          " if (localStorage.getItem(key) === null) { localStorage.setItem(key, items[key]); } });")
+
+def save_session(driver, path, username):
+    """Writes the browser's cookies (all domains) and linkedin.com localStorage to path."""
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    try:
+        local_storage = driver.execute_script(READ_LOCAL_STORAGE_JS)
+    except WebDriverException:
+        local_storage = {}
+    write_session(path, username, cookies, local_storage)
+
+def write_session(path, username, cookies, local_storage):
+    """Writes a session file (private to the current user) from cookies and localStorage items."""
+    state = {
+        "username": username,
+        "saved_at": time.time(),
+        "cookies": cookies,
+        "local_storage": local_storage or {},
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp" # Several workers may save at the same time
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+    try:
+        os.chmod(path, 0o600) # Readable by the current user only
+    except OSError:
+        pass
+    print(f"Session saved to '{path}'.")
+
+def load_session(path, username):
+    """Returns the saved session for username, or None if missing, for another account or expired."""
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Ignoring unreadable session file '{path}': {e}")
+        return None
+    if state.get("username") != username:
+        print(f"Session file '{path}' belongs to another account. Ignoring it.")
+        return None
+    auth = [c for c in state.get("cookies", []) if c.get("name") == AUTH_COOKIE]
+    if not auth:
+        return None
+    expires = auth[0].get("expires", -1)
+    if expires not in (None, -1) and expires < time.time(): # Cheap check before opening any page
+        print("Saved session has expired.")
+        return None
+    return state
+
+def session_cookies(state, fields=COOKIE_PARAM_FIELDS):
+    """Returns the saved cookies in the form the browser accepts them back (session cookies without 'expires')."""
+    cookies = [{key: c[key] for key in fields if key in c} for c in state["cookies"]]
+    for cookie in cookies:
+        if cookie.get("expires", -1) == -1: # Session cookie
+            cookie.pop("expires", None)
+    return cookies
+
+def is_logged_in(driver, timeout=8):
+    """Waits until the page shows the logged-in navigation (True) or a login/authwall page (False)."""
+    def settled(d):
+        if d.find_elements(By.ID, "global-nav-search"):
+            return "logged_in"
+        if any(marker in d.current_url for marker in LOGGED_OUT_MARKERS):
+            return "logged_out"
+        return False
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.2).until(settled) == "logged_in"
+    except TimeoutException:
+        return False
+
+def restore_session(driver, path, username, timeout=8):
+    """
+    Loads the saved cookies/localStorage into the browser and checks that LinkedIn accepts them.
+    Returns True if the browser is now logged in; False means a normal login is needed.
+    """
+    state = load_session(path, username)
+    if not state:
+        return False
+    print(f"Restoring saved session from '{path}'...")
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": session_cookies(state)}) # Works before visiting the site
+        driver.get(VERIFY_URL)
+        if not is_logged_in(driver, timeout):
+            print("Saved session is no longer valid.")
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {}) # Start the normal login from a clean state
+            return False
+        if state.get("local_storage"):
+            driver.execute_script(WRITE_LOCAL_STORAGE_JS, state["local_storage"])
+    except WebDriverException as e:
+        print(f"Could not restore the saved session: {e}")
+        return False
+    print("Logged in with the saved session.")
+    return True
@@ -0,0 +1,52 @@
+import pandas as pd
+from output_writers import SearchCheckpoint
+from scraper import LinkedInScraper
+
+SEARCH = "https://www.linkedin.com/search/results/people/?keywords=engineer"
+
+class OfflineScraper(LinkedInScraper):
+    """LinkedInScraper without a browser: only the per-search bookkeeping and the streaming output."""
+    def start_browser(self, browser_settings):
+        self.driver = None
+
+def page_records(page):
+    return [{"Name": f"Person {i}", "Title": None, "Location": None, "Profile URL": f"https://www.linkedin.com/in/person-{i}"}
+            for i in range((page - 1) * 10, page * 10)]
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = SearchCheckpoint(str(tmp_path / "people.csv"))
+    assert checkpoint.load(SEARCH) is None
+    checkpoint.save(SEARCH, 2, {"b", "a"}, 20)
+    state = checkpoint.load(SEARCH)
+    assert (state["last_completed_page"], state["profiles_written"], state["seen_urls"]) == (2, 20, ["a", "b"])
+    assert checkpoint.load(SEARCH + "&page=2") is None # Another search starts from scratch
+    checkpoint.save(SEARCH, 3, {"a"}, 30, completed=True)
+    assert checkpoint.load(SEARCH) is None # A completed search is not resumed
+
+def test_unreadable_checkpoint_is_ignored(tmp_path):
+    checkpoint = SearchCheckpoint(str(tmp_path / "people.csv"))
+    with open(checkpoint.path, 'w') as f:
+        f.write("{not json")
+    assert checkpoint.load(SEARCH) is None
+
+def test_interrupted_search_resumes_after_the_last_saved_page(tmp_path):
+    filename = str(tmp_path / "people.csv")
+    scraper = OfflineScraper("u", "p", stream=True)
+    assert scraper.begin_search(SEARCH, filename) == 1
+    scraper.add_page_records(page_records(1), 1)
+    scraper.add_page_records(page_records(2), 2)
+    scraper.page_failed(3, RuntimeError("boom"))
+    scraper.add_page_records(page_records(4), 4) # Done, but after the failed page
+    scraper.finish_stream(completed=False)
+
+    scraper = OfflineScraper("u", "p", stream=True)
+    assert scraper.begin_search(SEARCH, filename) == 3
+    assert scraper.add_page_records(page_records(3), 3) == 10
+    assert scraper.add_page_records(page_records(4), 4) == 0 # Already written before the interruption
+    scraper.finish_stream(completed=True)
+
+    rows = pd.read_csv(filename)
+    assert len(rows) == 40 and rows["Profile URL"].is_unique
+    scraper = OfflineScraper("u", "p", stream=True)
+    assert scraper.begin_search(SEARCH, filename) == 1 # Completed: running it again starts over
+    scraper.finish_stream(completed=False)
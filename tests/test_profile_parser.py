@@ -0,0 +1,63 @@
+import glob
+import os
+import pytest
+from bs4 import BeautifulSoup
+from profile_parser import parse_profiles, parse_results_page, PARSER_BACKENDS
+from selector_strategies import SelectorRegistry
+
+# The sanitized search pages in fixtures/ (also the default pages of benchmark.py offline)
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+FIXTURE_PAGES = sorted(os.path.basename(path) for path in glob.glob(os.path.join(FIXTURES_DIR, "*.html")))
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+def old_cascade(html):
+    """The original parsing code of LinkedInScraper.scrape_current_page (html.parser, no strainer), as the reference."""
+    soup = BeautifulSoup(html, 'html.parser')
+    profile_list_items = soup.select('ul.reusable-search__entity-result-list > li.reusable-search__result-container')
+    if not profile_list_items:
+        profile_list_items = soup.find_all('div', class_='linked-area')
+        if not profile_list_items:
+            profile_list_items = soup.find_all(lambda tag: tag.name == 'li' and 'result' in tag.get('class', []))
+    records = []
+    for item in profile_list_items:
+        name = title = location = profile_url = None
+        link_tag = item.select_one('span.entity-result__title-text a.app-aware-link')
+        if link_tag:
+            profile_url = link_tag.get('href', '').split('?')[0]
+            name_span = link_tag.select_one('span[aria-hidden="true"]')
+            name = name_span.text.strip() if name_span else link_tag.text.strip()
+        title_tag = item.select_one('div.entity-result__primary-subtitle') or item.select_one('p.entity-result__summary')
+        if title_tag:
+            title = title_tag.text.strip()
+        location_tag = item.select_one('div.entity-result__secondary-subtitle')
+        if location_tag:
+            location = location_tag.text.strip()
+        if (name and profile_url and name != "LinkedIn Member" and '/in/' in profile_url and
+                not profile_url.startswith('https://www.linkedin.com/search/')):
+            records.append({"Name": name, "Title": title, "Location": location, "Profile URL": profile_url})
+    return records
+
+def test_fixtures_cover_every_layout():
+    selectors = SelectorRegistry()
+    for name in FIXTURE_PAGES:
+        parse_profiles(read_fixture(name), selectors=selectors)
+    assert all(hits for hits, _ in selectors.hit_rates().values()) # Each built-in strategy matched at least one page
+
+@pytest.mark.parametrize("use_strainer", [True, False])
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+@pytest.mark.parametrize("page", FIXTURE_PAGES)
+def test_backends_match_old_cascade(page, backend, use_strainer):
+    html = read_fixture(page)
+    expected = old_cascade(html)
+    assert expected # Every fixture has real profiles
+    assert parse_profiles(html, backend=backend, use_strainer=use_strainer, selectors=SelectorRegistry()) == expected
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+def test_item_count_includes_hidden_members(backend):
+    records, item_count = parse_results_page(read_fixture("entity_list_page1.html"), backend=backend)
+    assert item_count == 10
+    assert len(records) < item_count
+    assert "LinkedIn Member" not in [record["Name"] for record in records]
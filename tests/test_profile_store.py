@@ -0,0 +1,23 @@
+from profile_store import ProfileStore, normalize_profile_url
+
+SEARCH_A = "https://www.linkedin.com/search/results/people/?keywords=engineer"
+SEARCH_B = "https://www.linkedin.com/search/results/people/?keywords=designer"
+
+def record(slug):
+    return {"Name": slug.title(), "Title": None, "Location": None, "Profile URL": f"https://www.linkedin.com/in/{slug}"}
+
+def test_profiles_of_an_earlier_search_are_seen_before(tmp_path):
+    store = ProfileStore(str(tmp_path / "store.db"))
+    assert store.record_profiles([record("ada"), record("grace")], SEARCH_A) == set()
+    seen = store.record_profiles([record("grace"), record("alan")], SEARCH_B)
+    assert seen == {normalize_profile_url(record("grace")["Profile URL"])}
+    store.close()
+
+def test_rerunning_a_search_does_not_see_its_own_profiles(tmp_path):
+    store = ProfileStore(str(tmp_path / "store.db"))
+    store.record_profiles([record("ada"), record("grace")], SEARCH_A)
+    # Same search again (e.g. after a crash before its CSV was written): nothing was seen in *another* search
+    assert store.record_profiles([record("ada"), record("grace")], SEARCH_A) == set()
+    store.record_profiles([record("ada")], SEARCH_B)
+    assert store.record_profiles([record("ada"), record("grace")], SEARCH_A) == {normalize_profile_url(record("ada")["Profile URL"])}
+    store.close()
@@ -0,0 +1,42 @@
+import pytest
+import rate_limiter
+from rate_limiter import RateLimiter
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake time.time() that only moves when the test says so, and no jitter."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+    monkeypatch.setattr(rate_limiter.random, "uniform", lambda low, high: 1.0)
+    return now
+
+def test_callers_are_spaced_at_the_current_rate(clock):
+    limiter = RateLimiter(rate=60, max_rate=60, burst=1)
+    assert [limiter.reserve() for _ in range(4)] == [0, 1, 2, 3] # One page per second, the first one at once
+    clock[0] += 10 # Idle time refills the bucket (up to burst)
+    assert limiter.reserve() == 0
+
+def test_callers_queued_during_a_pause_leave_one_by_one(clock):
+    limiter = RateLimiter(rate=60, max_rate=60, burst=1, cooldown=30)
+    limiter.report('challenge') # Halves the rate to 30/min and pauses for 30s
+    assert limiter.rate.value == 30
+    assert [limiter.reserve() for _ in range(3)] == [32, 34, 36] # Not all at 30s, when the pause ends
+
+def test_no_refill_during_a_pause(clock):
+    limiter = RateLimiter(rate=60, max_rate=60, burst=5, cooldown=30)
+    limiter.report('challenge')
+    clock[0] += 29 # Still paused: a refill over these 29s would fill the whole burst
+    assert limiter.reserve() == 1 + 2
+
+def test_pause_is_not_extended_by_more_blocked_tabs(clock):
+    limiter = RateLimiter(rate=60, max_rate=60, burst=1, cooldown=30)
+    limiter.report('challenge')
+    clock[0] += 10
+    limiter.report('throttled') # Another tab of the same burst of blocks
+    assert limiter.paused_until.value == 1030
+    assert limiter.cooldown.value == 60 # The next pause will be twice as long
+
+@pytest.mark.parametrize("min_rate", [0, -1])
+def test_min_rate_must_be_positive(min_rate):
+    with pytest.raises(ValueError):
+        RateLimiter(min_rate=min_rate)
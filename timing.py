@@ -0,0 +1,143 @@
+# --- Imports ---
+import contextvars
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# Per-phase timing of the scraper. Each page's phases are summed up, written as one JSON line
+# (optional) and added to per-search and whole-run totals, which can be exported in the
+# Prometheus text format (e.g. for node_exporter's textfile collector).
+PHASES = ("rate_limit", "navigation", "scroll_wait", "extraction", "parse", "records", "pagination", "save")
+# Phases dict of the page being loaded by the current asyncio task (see PhaseTimer.collect), None outside of one
+collecting_phases = contextvars.ContextVar("collecting_phases", default=None)
+
+class PhaseTimer:
+    def __init__(self, jsonl_path=None, prometheus_path=None):
+        self.jsonl_path = jsonl_path # Append one JSON line per page and per search here
+        self.prometheus_path = prometheus_path # Rewrite Prometheus counters here after every search
+        self.search_url = None
+        self.page_phases = {} # Current page: phase -> seconds
+        self.search_phases = {} # Current search: phase -> seconds
+        self.search_pages = 0
+        self.search_started = None
+        self.run_phases = {} # Whole run (all searches): phase -> seconds
+        self.run_pages = 0
+        self.run_profiles = 0
+        self.run_searches = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Times the code inside the 'with' block and adds it to the current page under `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds):
+        phases = collecting_phases.get()
+        if phases is None:
+            phases = self.page_phases
+        phases[name] = phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def collect(self):
+        """
+        Yields a dict that collects the phases timed inside the 'with' block (in this asyncio task)
+        instead of the current page. For pages that load concurrently: each load keeps its own
+        phases, and add_phases() adds them to the page when it is scraped.
+        """
+        phases = {}
+        token = collecting_phases.set(phases)
+        try:
+            yield phases
+        finally:
+            collecting_phases.reset(token)
+
+    def add_phases(self, phases):
+        for name, seconds in phases.items():
+            self.add(name, seconds)
+
+    def start_search(self, search_url):
+        self.search_url = search_url
+        self.page_phases = {}
+        self.search_phases = {}
+        self.search_pages = 0
+        self.search_started = time.time()
+
+    def end_page(self, page_number, profiles):
+        """Closes the current page: records its phases and adds them to the search totals."""
+        for name, seconds in self.page_phases.items():
+            self.search_phases[name] = self.search_phases.get(name, 0.0) + seconds
+        self.search_pages += 1
+        self.run_pages += 1
+        self.run_profiles += profiles
+        self._write_line({
+            "type": "page",
+            "search_url": self.search_url,
+            "page": page_number,
+            "profiles": profiles,
+            "phases": {name: round(seconds, 4) for name, seconds in self.page_phases.items()},
+            "total_s": round(sum(self.page_phases.values()), 4),
+        })
+        self.page_phases = {}
+
+    def end_search(self, profiles):
+        """Closes the current search. Phases timed after the last page (e.g. save) count for the search only."""
+        for name, seconds in self.page_phases.items():
+            self.search_phases[name] = self.search_phases.get(name, 0.0) + seconds
+        self.page_phases = {}
+        for name, seconds in self.search_phases.items():
+            self.run_phases[name] = self.run_phases.get(name, 0.0) + seconds
+        self.run_searches += 1
+        self._write_line({
+            "type": "search",
+            "search_url": self.search_url,
+            "pages": self.search_pages,
+            "profiles": profiles,
+            "wall_s": round(time.time() - self.search_started, 3) if self.search_started else None,
+            "phases": {name: round(seconds, 4) for name, seconds in self.search_phases.items()},
+            "per_page_s": {name: round(seconds / self.search_pages, 4)
+                           for name, seconds in self.search_phases.items()} if self.search_pages else {},
+        })
+        if self.prometheus_path:
+            self.write_prometheus(self.prometheus_path)
+
+    def summary(self, phases=None):
+        """One-line human readable summary, e.g. 'parse 0.41s, scroll_wait 3.20s'."""
+        phases = self.search_phases if phases is None else phases
+        ordered = [name for name in PHASES if name in phases] + sorted(set(phases) - set(PHASES))
+        return ", ".join(f"{name} {phases[name]:.2f}s" for name in ordered) or "nothing timed"
+
+    def prometheus_text(self):
+        lines = [
+            "# HELP linkedin_scraper_phase_seconds_total Time spent per scraper phase.",
+            "# TYPE linkedin_scraper_phase_seconds_total counter",
+        ]
+        lines += [f'linkedin_scraper_phase_seconds_total{{phase="{name}"}} {seconds:.6f}'
+                  for name, seconds in sorted(self.run_phases.items())]
+        lines += [
+            "# HELP linkedin_scraper_pages_total Result pages scraped.",
+            "# TYPE linkedin_scraper_pages_total counter",
+            f"linkedin_scraper_pages_total {self.run_pages}",
+            "# HELP linkedin_scraper_profiles_total New unique profiles collected.",
+            "# TYPE linkedin_scraper_profiles_total counter",
+            f"linkedin_scraper_profiles_total {self.run_profiles}",
+            "# HELP linkedin_scraper_searches_total Searches finished.",
+            "# TYPE linkedin_scraper_searches_total counter",
+            f"linkedin_scraper_searches_total {self.run_searches}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path) # Scrapers of the file never see it half-written
+
+    def _write_line(self, record):
+        if not self.jsonl_path:
+            return
+        with open(self.jsonl_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")